@@ -3,6 +3,11 @@ Main Entry Point - Direct Package Execution 🚀
 
 Enables running the package directly using `python -m eidosian_refactor`,
 providing a convenient entry point for command-line usage.
+
+The analyzer is pure Python, so it also runs unchanged under PyPy, whose
+JIT speeds up the AST-heavy passes on large sources:
+
+    pypy3 -m eidosian_refactor --warmup path/to/source.py
 """
 
 import sys
@@ -12,10 +12,14 @@ Core capabilities:
 """
 
 import ast
+import bisect
 import re
 from pathlib import Path
+from functools import cached_property
 from typing import Dict, List, Set, Tuple, Optional, Union, Any
-import networkx as nx
+
+from .core.graph import DiGraph
+from .core.utils import build_keyword_automaton, map_source, match_keyword_group
 
 # ╭──────────────────────────────────────────────────────╮
 # │  🔍 Analysis Configuration - Detection Parameters    │
@@ -33,6 +37,23 @@ MODULE_BOUNDARY_PATTERNS = [
     r"@\w+\s*(\(.*?\))?\s*\n+def ",            # Decorated function groups
 ]
 
+# Compiled once: a fused line-anchored alternation so the whole source is
+# scanned for boundaries in one pass, and a matcher for blank lines
+_MULTILINE_BOUNDARY_RE = re.compile(
+    "^(?:" + "|".join(f"(?:{pattern})" for pattern in MODULE_BOUNDARY_PATTERNS) + ")",
+    re.MULTILINE,
+)
+_BLANK_LINE_RE = re.compile(r"^[^\S\n]*$", re.MULTILINE)
+
+# Semantic extraction patterns
+_DOCSTRING_RE = re.compile(r'"""(.*?)"""', re.DOTALL)
+_COMMENT_RE = re.compile(r'# ([A-Za-z].*)')
+
+# Module naming patterns, tried in order by _extract_module_name
+_CLASS_NAME_RE = re.compile(r"class ([A-Z][a-zA-Z0-9_]*)")
+_HEADER_RE = re.compile(r"# [│╭╰][ ]*([A-Za-z ]+?)[ ]*[│╮╯]")
+_FUNC_NAME_RE = re.compile(r"def ([a-z][a-zA-Z0-9_]*)\(")
+
 # Semantic indicators for module purpose inference
 MODULE_PURPOSE_INDICATORS = {
     "util": ["utility", "helper", "tool", "common"],
@@ -42,6 +63,10 @@ MODULE_PURPOSE_INDICATORS = {
     "config": ["config", "setting", "parameter", "environment"],
 }
 
+# Purpose indicators compiled once for a single scan per name
+_PURPOSE_AUTOMATON = build_keyword_automaton(MODULE_PURPOSE_INDICATORS)
+
+
 # ╭──────────────────────────────────────────────────────╮
 # │  🧠 Core Analysis Logic - Structural Intelligence    │
 # ╰──────────────────────────────────────────────────────╯
@@ -66,12 +91,25 @@ class CodeAnalyzer:
         if not self.source_path.exists():
             raise FileNotFoundError(f"Source file not found: {self.source_path}")
             
-        self.source_code = self.source_path.read_text(encoding='utf-8')
-        self.tree = ast.parse(self.source_code)
+        # Map the file rather than reading it; text is decoded only on demand
+        self.source_bytes = map_source(self.source_path)
+        self.tree = ast.parse(self.source_bytes)
         self.modules = []
-        self.dependencies = nx.DiGraph()
+        self.dependencies: DiGraph[str] = DiGraph()
         self.symbol_table = {}
     
+    @cached_property
+    def source_code(self) -> str:
+        """Source text, decoded from the mapped file on first access.
+        
+        Newlines are translated as ``read_text`` would, so CRLF and CR line
+        endings never reach module content.
+        """
+        source = str(self.source_bytes, 'utf-8')
+        if '\r' in source:
+            source = source.replace('\r\n', '\n').replace('\r', '\n')
+        return source
+    
     def analyze(self) -> Dict[str, Any]:
         """Perform full structural analysis of the source code.
         
@@ -126,22 +164,28 @@ class CodeAnalyzer:
     
     def _detect_module_boundaries(self) -> None:
         """Detect logical boundaries for module splitting."""
-        lines = self.source_code.split('\n')
+        source = self.source_code
+        line_starts = _line_starts(source)
+        line_count = len(line_starts)
+        
+        def flag_lines(pattern: re.Pattern) -> List[bool]:
+            flags = [False] * line_count
+            for match in pattern.finditer(source):
+                flags[bisect.bisect_right(line_starts, match.start()) - 1] = True
+            return flags
+        
+        # Flag boundary and blank lines once, each in a single pass over the source
+        is_boundary = flag_lines(_MULTILINE_BOUNDARY_RE)
+        is_blank = flag_lines(_BLANK_LINE_RE)
         
         # Find sections based on boundary patterns
-        section_boundaries = []
-        for i, line in enumerate(lines):
-            for pattern in MODULE_BOUNDARY_PATTERNS:
-                if re.match(pattern, line):
-                    section_boundaries.append(i)
+        section_boundaries = [index for index, flag in enumerate(is_boundary) if flag]
         
-        # Find class and function definitions
+        # Find top-level class and function definitions
         class_funcs = []
-        for node in ast.walk(self.tree):
+        for node in self.tree.body:
             if isinstance(node, (ast.ClassDef, ast.FunctionDef)) and not node.name.startswith('_'):
-                # Top-level definitions only
-                if isinstance(node.parent, ast.Module):  
-                    class_funcs.append(node.lineno - 1)  # Convert to 0-based index
+                class_funcs.append(node.lineno - 1)  # Convert to 0-based index
         
         # Combine and sort all potential boundaries
         all_boundaries = sorted(set(section_boundaries + class_funcs))
@@ -166,16 +210,17 @@ class CodeAnalyzer:
             end_line = group[-1]
             
             # Expand to include associated code
-            while start_line > 0 and lines[start_line - 1].strip() and not any(re.match(p, lines[start_line - 1]) for p in MODULE_BOUNDARY_PATTERNS):
+            while start_line > 0 and not is_blank[start_line - 1] and not is_boundary[start_line - 1]:
                 start_line -= 1
             
-            while end_line < len(lines) - 1 and lines[end_line + 1].strip():
+            while end_line < line_count - 1 and not is_blank[end_line + 1]:
                 end_line += 1
-                if end_line + 1 < len(lines) and any(re.match(p, lines[end_line + 1]) for p in MODULE_BOUNDARY_PATTERNS):
+                if end_line + 1 < line_count and is_boundary[end_line + 1]:
                     break
             
-            # Extract module name and code
-            content = '\n'.join(lines[start_line:end_line + 1])
+            # Extract module name and code as one slice of the original source
+            content_end = line_starts[end_line + 1] - 1 if end_line + 1 < line_count else len(source)
+            content = source[line_starts[start_line]:content_end]
             name = self._extract_module_name(content, f"module_{i}")
             
             self.modules.append({
@@ -188,19 +233,19 @@ class CodeAnalyzer:
     def _extract_module_name(self, content: str, default: str) -> str:
         """Extract appropriate module name from content."""
         # Try to find a class name
-        class_match = re.search(r"class ([A-Z][a-zA-Z0-9_]*)", content)
+        class_match = _CLASS_NAME_RE.search(content)
         if class_match:
             return class_match.group(1).lower()
         
         # Look for section headers
-        header_match = re.search(r"# [│╭╰][ ]*([A-Za-z ]+?)[ ]*[│╮╯]", content)
+        header_match = _HEADER_RE.search(content)
         if header_match:
             # Convert "Section Name" to "section_name"
             section_name = header_match.group(1).strip().lower().replace(' ', '_')
             return section_name
         
         # Look for main function
-        func_match = re.search(r"def ([a-z][a-zA-Z0-9_]*)\(", content)
+        func_match = _FUNC_NAME_RE.search(content)
         if func_match:
             return func_match.group(1)
         
@@ -248,7 +293,7 @@ class CodeAnalyzer:
             content = module["content"]
             
             # Try to extract purpose from docstrings
-            docstring_match = re.search(r'"""(.*?)"""', content, re.DOTALL)
+            docstring_match = _DOCSTRING_RE.search(content)
             if docstring_match:
                 docstring = docstring_match.group(1).strip()
                 # Get first line as purpose
@@ -257,7 +302,7 @@ class CodeAnalyzer:
                 module["docstring"] = docstring
             else:
                 # Try to extract from comments
-                comment_match = re.search(r'# ([A-Za-z].*)', content)
+                comment_match = _COMMENT_RE.search(content)
                 if comment_match:
                     module["purpose"] = comment_match.group(1).strip()
                 else:
@@ -289,10 +334,9 @@ class CodeAnalyzer:
     def _infer_purpose(self, content: str, name: str) -> str:
         """Infer the purpose of a module from its content and name."""
         # Check module name against known patterns
-        for purpose, indicators in MODULE_PURPOSE_INDICATORS.items():
-            for indicator in indicators:
-                if indicator in name.lower():
-                    return f"{purpose.title()} module for {name.replace('_', ' ')}"
+        purpose = match_keyword_group(_PURPOSE_AUTOMATON, name.lower())
+        if purpose:
+            return f"{purpose.title()} module for {name.replace('_', ' ')}"
         
         # Check content for clues
         if "class" in content and "def __init__" in content:
@@ -303,6 +347,26 @@ class CodeAnalyzer:
         return f"Handles {name.replace('_', ' ')} operations"
 
 
+def _line_starts(source: str) -> List[int]:
+    """Compute the offset at which each line of the source begins.
+    
+    Lines are then read as slices of the source on demand, so no list of
+    line strings is ever materialized.
+    
+    Args:
+        source: Source code text
+        
+    Returns:
+        Start offsets, one per line as produced by ``source.split('\\n')``
+    """
+    starts = [0]
+    newline = source.find('\n')
+    while newline != -1:
+        starts.append(newline + 1)
+        newline = source.find('\n', newline + 1)
+    return starts
+
+
 # ╭──────────────────────────────────────────────────────╮
 # │  🔌 Public Interface - Analysis Entry Points         │
 # ╰──────────────────────────────────────────────────────╯
@@ -6,22 +6,55 @@ detecting natural module boundaries, and identifying dependencies
 between components.
 """
 
+import copy
+import hashlib
+import os
+import pickle
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Union
+from typing import Dict, Any, Optional, Tuple, Union
 
+from .. import __version__
 from .code_analyzer import CodeAnalyzer
+from .module_detector import detect_module_boundaries
+from .dependency_analyzer import build_dependency_graph
+from .semantic_analyzer import extract_semantic_purpose
+from .import_analyzer import analyze_imports
 
-__all__ = ["analyze_code"]
+__all__ = ["analyze_code", "warm_up"]
 
+# Small representative sample used to exercise every analysis pass
+_WARMUP_SOURCE = '''
+import os
+from typing import List
 
-def analyze_code(source_path: Union[str, Path]) -> Dict[str, Any]:
+# ── Helpers ──────────────────────────────────────────
+def _join(parts: List[str]) -> str:
+    """Join path parts into a single path."""
+    return os.path.join(*parts)
+
+# ── Records ──────────────────────────────────────────
+class _Record:
+    """Simple named record."""
+
+    def __init__(self, name: str):
+        self.name = _join([name])
+'''
+
+
+def analyze_code(source_path: Union[str, Path], use_cache: bool = True) -> Dict[str, Any]:
     """Analyze a Python source file for structural insights.
     
     High-level function that performs comprehensive code analysis
-    and returns structured results.
+    and returns structured results. Results are cached in memory and on
+    disk keyed by the file's path, modification time, size and the
+    analyzer version and source, so re-analyzing an unchanged file costs a
+    single stat. Every call returns its own copy of the cached results;
+    cached modules carry no AST in ``tree``.
     
     Args:
         source_path: Path to Python file to analyze
+        use_cache: Whether to reuse and store results in the result caches
         
     Returns:
         Dict containing analysis results with modules, dependencies, etc.
@@ -29,5 +62,136 @@ def analyze_code(source_path: Union[str, Path]) -> Dict[str, Any]:
     Raises:
         FileNotFoundError: If source file doesn't exist
     """
-    analyzer = CodeAnalyzer(source_path)
-    return analyzer.analyze()
+    if not use_cache:
+        return CodeAnalyzer(source_path).analyze()
+    
+    source_path = Path(source_path)
+    if not source_path.exists():
+        raise FileNotFoundError(f"Source file not found: {source_path}")
+    
+    resolved = str(source_path.resolve())
+    stat = os.stat(resolved)
+    results = _analyze_cached(resolved, stat.st_mtime_ns, stat.st_size)
+    
+    # Cached results are shared between calls, so each caller gets its own
+    # deep copy, with the modules and graph, to change freely; the copy
+    # reports this caller's spelling of the path
+    results = copy.deepcopy(results)
+    results["file_info"]["path"] = str(source_path)
+    return results
+
+
+def warm_up(rounds: int = 50) -> None:
+    """Run every analysis pass over a small built-in sample.
+    
+    Under a tracing JIT such as PyPy's, this lets the hot AST walks get
+    compiled before the real source is analyzed. On CPython it is harmless.
+    
+    Args:
+        rounds: Number of times to analyze the sample
+    """
+    for _ in range(rounds):
+        analyze_imports(_WARMUP_SOURCE)
+        modules = detect_module_boundaries(_WARMUP_SOURCE)
+        build_dependency_graph(modules)
+        extract_semantic_purpose(modules)
+
+
+# ╭──────────────────────────────────────────────────────╮
+# │  💾 Result Cache - Memory and On-Disk Memoization    │
+# ╰──────────────────────────────────────────────────────╯
+
+# Bumped whenever the shape of stored results changes
+_CACHE_FORMAT = 3
+
+# Packages whose source determines the analysis results
+_ANALYSIS_PACKAGES = (Path(__file__).parent, Path(__file__).parent.parent / "core")
+
+
+def _cache_dir() -> Path:
+    """Locate the analysis cache directory, honouring XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "eidosian_refactor"
+
+
+@lru_cache(maxsize=128)
+def _analyze_cached(resolved: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Analyze a file state once per process, backed by the on-disk cache.
+    
+    Args:
+        resolved: Resolved path of the source file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        Analysis results for this exact file state
+    """
+    cache_file, cache_key = _cache_entry(resolved, mtime_ns, size)
+    results = _load_cached(cache_file, cache_key)
+    if results is None:
+        results = CodeAnalyzer(resolved).analyze()
+        # Module ASTs only serve the analysis passes, so they are not kept
+        for module in results["modules"]:
+            module.tree = None
+        _store_cached(cache_file, cache_key, results)
+    return results
+
+
+@lru_cache(maxsize=None)
+def _analyzer_fingerprint() -> str:
+    """Hash the analyzer's own source once per process.
+    
+    Part of the cache key, so results stored by a different version of the
+    analysis logic are never served, even when ``__version__`` is unchanged.
+    
+    Returns:
+        Hex digest of the analysis packages' source files
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for package in _ANALYSIS_PACKAGES:
+        for source_file in sorted(package.glob("*.py")):
+            digest.update(source_file.name.encode("utf-8"))
+            digest.update(source_file.read_bytes())
+    return digest.hexdigest()
+
+
+def _cache_entry(resolved: str, mtime_ns: int, size: int) -> Tuple[Path, Tuple[Any, ...]]:
+    """Compute the cache file and validity key for a source file state.
+    
+    Args:
+        resolved: Resolved path of the source file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        Tuple of (cache file path, key identifying this exact file state)
+    """
+    digest = hashlib.blake2b(resolved.encode("utf-8"), digest_size=16).hexdigest()
+    key = (resolved, mtime_ns, size, __version__, _CACHE_FORMAT, _analyzer_fingerprint())
+    return _cache_dir() / f"{digest}.pkl", key
+
+
+def _load_cached(cache_file: Path, cache_key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+    """Load cached results if they were stored under the same key.
+    
+    A missing, truncated or corrupt entry, or one referring to types that
+    no longer exist, is treated as a miss, as is a stale one.
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            stored_key, results = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+    return results if stored_key == cache_key else None
+
+
+def _store_cached(cache_file: Path, cache_key: Tuple[Any, ...], results: Dict[str, Any]) -> None:
+    """Store results in the cache, silently skipping if it isn't writable."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_file, "wb") as f:
+            pickle.dump((cache_key, results), f, protocol=5)
+        os.replace(temp_file, cache_file)
+    except (OSError, pickle.PicklingError):
+        pass
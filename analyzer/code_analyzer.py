@@ -5,16 +5,18 @@ Coordinates the complete code analysis process, integrating results from
 specialized analyzers to build comprehensive structural understanding.
 """
 
+import ast
+import bisect
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Union
-
-import networkx as nx
+from typing import Dict, Any, List, Union
 
 from ..core.types import AnalysisResult
+from ..core.utils import map_source
 from .module_detector import detect_module_boundaries
 from .dependency_analyzer import build_dependency_graph
 from .semantic_analyzer import extract_semantic_purpose
-from .import_analyzer import analyze_imports
+from .import_analyzer import collect_imports
 
 
 class CodeAnalyzer:
@@ -37,20 +39,44 @@ class CodeAnalyzer:
         if not self.source_path.exists():
             raise FileNotFoundError(f"Source file not found: {self.source_path}")
             
-        self.source_code = self.source_path.read_text(encoding='utf-8')
+        # Map the file rather than reading it; text is decoded only on demand
+        self.source_bytes = map_source(self.source_path)
         self.symbol_table = {}
     
+    @cached_property
+    def source_code(self) -> str:
+        """Source text, decoded from the mapped file on first access.
+        
+        Newlines are translated as ``read_text`` would, so CRLF and CR line
+        endings never reach module content.
+        """
+        source = str(self.source_bytes, 'utf-8')
+        if '\r' in source:
+            source = source.replace('\r\n', '\n').replace('\r', '\n')
+        return source
+    
     def analyze(self) -> Dict[str, Any]:
         """Perform full structural analysis of the source code.
         
         Returns:
             Complete analysis results with structural insights
         """
-        # Parse imports and build initial symbol table
-        self.symbol_table = analyze_imports(self.source_code)
+        # Parse the full source once, straight from the mapped bytes, and
+        # share the tree between passes
+        tree = ast.parse(self.source_bytes, str(self.source_path))
+        
+        # Collect imports and build initial symbol table
+        self.symbol_table = collect_imports(tree)
         
         # Detect logical boundaries in the code
-        modules = detect_module_boundaries(self.source_code)
+        modules = detect_module_boundaries(self.source_code, tree)
+        
+        # Slice each module's AST out of the full tree instead of reparsing it;
+        # top-level statements are in line order, so their bounds are bisected
+        starts = [node.lineno for node in tree.body]
+        ends = [node.end_lineno or node.lineno for node in tree.body]
+        for module in modules:
+            module.tree = _slice_module_ast(tree, starts, ends, module.start_line, module.end_line)
         
         # Build dependency graph between identified components
         dependencies = build_dependency_graph(modules)
@@ -70,3 +96,28 @@ class CodeAnalyzer:
                 "stem": self.source_path.stem,
             }
         }
+
+
+def _slice_module_ast(
+    tree: ast.Module,
+    starts: List[int],
+    ends: List[int],
+    start_line: int,
+    end_line: int
+) -> ast.Module:
+    """Build a module AST from the top-level statements within a line range.
+    
+    Args:
+        tree: AST of the full source
+        starts: First line (1-based) of each top-level statement
+        ends: Last line (1-based) of each top-level statement
+        start_line: First line of the module (0-based)
+        end_line: Last line of the module (0-based, inclusive)
+        
+    Returns:
+        Module AST holding every top-level statement overlapping the range
+    """
+    # Statements ending after the module starts and starting before it ends
+    first = bisect.bisect_right(ends, start_line)
+    last = bisect.bisect_right(starts, end_line + 1)
+    return ast.Module(body=tree.body[first:last], type_ignores=[])
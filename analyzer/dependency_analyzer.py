@@ -6,44 +6,54 @@ symbol usage and reference patterns across modules.
 """
 
 import ast
-from typing import Dict, List, Set, Any
+from typing import Dict, FrozenSet, List, Set, Any
 
-import networkx as nx
+from ..core.graph import DiGraph
+from ..core.types import ModuleInfo
+from ..core.utils import NameHandler, NameSink, collect_names, parse_cached
 
 
-def build_dependency_graph(modules: List[Dict[str, Any]]) -> nx.DiGraph:
+def build_dependency_graph(modules: List[ModuleInfo]) -> DiGraph[str]:
     """Build a directed graph of dependencies between modules.
     
     Args:
-        modules: List of module dictionaries
+        modules: List of detected modules
         
     Returns:
-        NetworkX DiGraph representing module dependencies
+        DiGraph representing module dependencies
     """
-    dependencies = nx.DiGraph()
+    dependencies: DiGraph[str] = DiGraph()
+    
+    # Lay the per-module fields out as parallel lists indexed by module position
+    names = [module.name for module in modules]
+    trees = [module.tree or parse_cached(module.content) for module in modules]
+    
+    # Intern symbol names to small integer ids shared by both sides of the lookup
+    symbol_ids: Dict[str, int] = {}
+    referenced = [_intern_names(extract_referenced_names(tree), symbol_ids) for tree in trees]
+    defined = [_intern_names(extract_defined_names(tree), symbol_ids) for tree in trees]
     
     # Add nodes for all modules
-    for module in modules:
-        dependencies.add_node(module["name"], info=module)
+    for name, module in zip(names, modules):
+        dependencies.add_node(name, info=module)
     
-    # Add dependency edges
-    for i, module in enumerate(modules):
-        module_ast = ast.parse(module["content"])
-        
-        # Extract all names referenced in this module
-        referenced_names = extract_referenced_names(module_ast)
+    # Index every defined symbol to the modules that define it
+    definers: Dict[int, List[int]] = {}
+    for j, defined_ids in enumerate(defined):
+        for symbol in defined_ids:
+            definers.setdefault(symbol, []).append(j)
+    
+    # Add dependency edges by following each referenced symbol to its definers
+    for i, referenced_ids in enumerate(referenced):
+        targets: Set[int] = set()
+        for symbol in referenced_ids:
+            targets.update(definers.get(symbol, ()))
+        targets.discard(i)
         
-        # Check if names are defined in other modules
-        for j, other_module in enumerate(modules):
-            if i == j:
-                continue
-                
-            other_ast = ast.parse(other_module["content"])
-            defined_names = extract_defined_names(other_ast)
-            
-            # If this module references names defined in the other module, add dependency
-            if referenced_names.intersection(defined_names):
-                dependencies.add_edge(module["name"], other_module["name"])
+        # Sorted so edges keep the module order
+        source = names[i]
+        for j in sorted(targets):
+            dependencies.add_edge(source, names[j])
     
     return dependencies
 
@@ -57,27 +67,14 @@ def extract_referenced_names(tree: ast.AST) -> Set[str]:
     Returns:
         Set of referenced name strings
     """
-    referenced_names = set()
-    
-    for node in ast.walk(tree):
-        # Variables being accessed
-        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
-            referenced_names.add(node.id)
-        
-        # Function calls
-        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
-            referenced_names.add(node.func.id)
-            
-        # Attribute access (obj.attr)
-        elif isinstance(node, ast.Attribute) and isinstance(node.ctx, ast.Load):
-            if isinstance(node.value, ast.Name):
-                referenced_names.add(node.value.id)
-    
-    return referenced_names
+    return collect_names(tree, _REFERENCE_HANDLERS)
 
 
 def extract_defined_names(tree: ast.AST) -> Set[str]:
-    """Extract all names that are defined in the AST.
+    """Extract the top-level names that are defined in the AST.
+    
+    Only direct children of the tree are inspected: names bound inside
+    function or class bodies are local and cannot be shared across modules.
     
     Args:
         tree: AST to analyze
@@ -85,25 +82,79 @@ def extract_defined_names(tree: ast.AST) -> Set[str]:
     Returns:
         Set of defined name strings
     """
-    defined_names = set()
+    names: Set[str] = set()
+    add = names.add
     
-    for node in ast.walk(tree):
-        # Function definitions
-        if isinstance(node, ast.FunctionDef):
-            defined_names.add(node.name)
-            
-        # Class definitions
-        elif isinstance(node, ast.ClassDef):
-            defined_names.add(node.name)
-            
-        # Variable assignments
-        elif isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name):
-                    defined_names.add(target.id)
-                    
-        # Variable annotations
-        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
-            defined_names.add(node.target.id)
+    for node in ast.iter_child_nodes(tree):
+        handler = _DEFINITION_HANDLERS.get(type(node))
+        if handler is not None:
+            handler(node, add)
     
-    return defined_names
+    return names
+
+
+def _intern_names(names: Set[str], symbol_ids: Dict[str, int]) -> FrozenSet[int]:
+    """Map names to integer ids, assigning new ids on first sight.
+    
+    Args:
+        names: Names to intern
+        symbol_ids: Shared name-to-id table, updated in place
+        
+    Returns:
+        Frozen set of the names' ids
+    """
+    return frozenset([symbol_ids.setdefault(name, len(symbol_ids)) for name in names])
+
+
+# ╭──────────────────────────────────────────────────────╮
+# │  🌳 Traversal Handlers - Names by Node Type          │
+# ╰──────────────────────────────────────────────────────╯
+
+def _reference_name(node: ast.Name, add: NameSink) -> None:
+    # Variables being accessed
+    if isinstance(node.ctx, ast.Load):
+        add(node.id)
+
+
+def _reference_call(node: ast.Call, add: NameSink) -> None:
+    # Function calls
+    if isinstance(node.func, ast.Name):
+        add(node.func.id)
+
+
+def _reference_attribute(node: ast.Attribute, add: NameSink) -> None:
+    # Attribute access (obj.attr)
+    if isinstance(node.ctx, ast.Load) and isinstance(node.value, ast.Name):
+        add(node.value.id)
+
+
+def _define_named(node: Any, add: NameSink) -> None:
+    # Function and class definitions
+    add(node.name)
+
+
+def _define_assign(node: ast.Assign, add: NameSink) -> None:
+    # Variable assignments
+    for target in node.targets:
+        if isinstance(target, ast.Name):
+            add(target.id)
+
+
+def _define_annotated(node: ast.AnnAssign, add: NameSink) -> None:
+    # Variable annotations
+    if isinstance(node.target, ast.Name):
+        add(node.target.id)
+
+
+_REFERENCE_HANDLERS: Dict[type, NameHandler] = {
+    ast.Name: _reference_name,
+    ast.Call: _reference_call,
+    ast.Attribute: _reference_attribute,
+}
+
+_DEFINITION_HANDLERS: Dict[type, NameHandler] = {
+    ast.FunctionDef: _define_named,
+    ast.ClassDef: _define_named,
+    ast.Assign: _define_assign,
+    ast.AnnAssign: _define_annotated,
+}
@@ -6,10 +6,16 @@ symbol table and track external dependencies.
 """
 
 import ast
-from typing import Dict, Any
+import sys
+from typing import Callable, Dict, FrozenSet, Any
 
+SymbolTable = Dict[str, Dict[str, Any]]
 
-def analyze_imports(source_code: str) -> Dict[str, Dict[str, Any]]:
+# Top-level standard library module names, resolved once at import time
+_STDLIB: FrozenSet[str] = frozenset(sys.stdlib_module_names)
+
+
+def analyze_imports(source_code: str) -> SymbolTable:
     """Analyze imports in the source code and build symbol table.
     
     Args:
@@ -18,36 +24,59 @@ def analyze_imports(source_code: str) -> Dict[str, Dict[str, Any]]:
     Returns:
         Symbol table with import information
     """
-    tree = ast.parse(source_code)
-    symbol_table = {}
+    return collect_imports(ast.parse(source_code))
+
+
+def collect_imports(tree: ast.AST) -> SymbolTable:
+    """Build the import symbol table from an already parsed AST.
     
-    for node in ast.walk(tree):
-        # Direct imports: import module, import module as alias
-        if isinstance(node, ast.Import):
-            for name in node.names:
-                symbol_table[name.asname or name.name] = {
-                    "type": "import",
-                    "source": name.name,
-                    "alias": name.asname,
-                    "lineno": node.lineno
-                }
+    Args:
+        tree: AST of the source code
         
-        # From imports: from module import name, from module import name as alias
-        elif isinstance(node, ast.ImportFrom):
-            module = node.module
-            for name in node.names:
-                symbol_table[name.asname or name.name] = {
-                    "type": "import_from",
-                    "source": module,
-                    "name": name.name,
-                    "alias": name.asname,
-                    "lineno": node.lineno
-                }
+    Returns:
+        Symbol table with import information
+    """
+    symbol_table: SymbolTable = {}
+    
+    for node in ast.walk(tree):
+        recorder = _IMPORT_RECORDERS.get(type(node))
+        if recorder is not None:
+            recorder(node, symbol_table)
     
     return symbol_table
 
 
-def categorize_imports(symbol_table: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+def _record_import(node: ast.Import, symbol_table: SymbolTable) -> None:
+    # Direct imports: import module, import module as alias
+    for name in node.names:
+        symbol_table[name.asname or name.name] = {
+            "type": "import",
+            "source": name.name,
+            "alias": name.asname,
+            "lineno": node.lineno
+        }
+
+
+def _record_import_from(node: ast.ImportFrom, symbol_table: SymbolTable) -> None:
+    # From imports: from module import name, from module import name as alias
+    module = node.module
+    for name in node.names:
+        symbol_table[name.asname or name.name] = {
+            "type": "import_from",
+            "source": module,
+            "name": name.name,
+            "alias": name.asname,
+            "lineno": node.lineno
+        }
+
+
+_IMPORT_RECORDERS: Dict[type, Callable[[Any, SymbolTable], None]] = {
+    ast.Import: _record_import,
+    ast.ImportFrom: _record_import_from,
+}
+
+
+def categorize_imports(symbol_table: SymbolTable) -> Dict[str, SymbolTable]:
     """Categorize imports by type (standard lib, third-party, local).
     
     Args:
@@ -60,17 +89,11 @@ def categorize_imports(symbol_table: Dict[str, Dict[str, Any]]) -> Dict[str, Dic
     third_party = {}
     local = {}
     
-    import sys
-    import pkgutil
-    
-    # Get list of standard library modules
-    stdlib_modules = set(m[1] for m in pkgutil.iter_modules(sys.stdlib_module_names))
-    
     for symbol, info in symbol_table.items():
         source = info["source"] if info["type"] == "import" else info.get("source", "")
         top_level = source.split('.')[0]
         
-        if top_level in stdlib_modules:
+        if top_level in _STDLIB:
             standard_lib[symbol] = info
         elif source.startswith('.'):
             local[symbol] = info
@@ -6,75 +6,98 @@ structural analysis, and semantic clustering techniques.
 """
 
 import ast
+import bisect
+import heapq
 import re
-from typing import List, Dict, Any, Tuple
+from itertools import pairwise
+from typing import List, Optional, Tuple
 
-from ..core.config import COMPILED_BOUNDARY_PATTERNS
+from ..core.config import COMBINED_BOUNDARY_RE, COMPILED_BOUNDARY_PATTERNS
+from ..core.types import ModuleInfo
+from ..core.utils import parse_cached
 
+# Boundary patterns allowing leading indentation, matching how expansion
+# compares stripped lines; blank lines are empty or whitespace-only
+_INDENTED_BOUNDARY_RE = re.compile(
+    r"(?m)^[^\S\n]*(?:" + "|".join(f"(?:{pattern.pattern})" for pattern in COMPILED_BOUNDARY_PATTERNS) + ")"
+)
+_BLANK_LINE_RE = re.compile(r"(?m)^[^\S\n]*$")
 
-def detect_module_boundaries(source_code: str) -> List[Dict[str, Any]]:
+# Module naming patterns, tried in order by _extract_module_name
+_CLASS_NAME_RE = re.compile(r"class ([A-Z][a-zA-Z0-9_]*)")
+_HEADER_RE = re.compile(r"# [│╭╰][ ]*([A-Za-z ]+?)[ ]*[│╮╯]")
+_FUNC_NAME_RE = re.compile(r"def ([a-z][a-zA-Z0-9_]*)\(")
+
+
+def detect_module_boundaries(source_code: str, tree: Optional[ast.Module] = None) -> List[ModuleInfo]:
     """Detect logical boundaries for module splitting.
     
     Args:
         source_code: Source code to analyze
+        tree: AST of the source code, parsed from it when not supplied
         
     Returns:
         List of detected modules with their boundaries and content
     """
-    lines = source_code.split('\n')
-    tree = ast.parse(source_code)
+    if tree is None:
+        tree = parse_cached(source_code)
     
     # Find sections based on boundary patterns
-    section_boundaries = _find_section_boundaries(lines)
+    section_boundaries = _find_section_boundaries(source_code)
     
     # Find class and function definitions
     class_funcs = _find_definition_boundaries(tree)
     
-    # Combine and sort all potential boundaries
-    all_boundaries = sorted(set(section_boundaries + class_funcs))
+    # Combine both sorted boundary lists in one merge, dropping duplicates
+    all_boundaries: List[int] = []
+    for boundary in heapq.merge(section_boundaries, class_funcs):
+        if not all_boundaries or boundary != all_boundaries[-1]:
+            all_boundaries.append(boundary)
     
     # Group closely related boundaries to form coherent modules
     grouped_boundaries = _group_related_boundaries(all_boundaries)
     
     # Convert grouped boundaries into module definitions
-    return _create_module_definitions(grouped_boundaries, lines)
+    return _create_module_definitions(grouped_boundaries, source_code)
 
 
-def _find_section_boundaries(lines: List[str]) -> List[int]:
+def _find_section_boundaries(source_code: str) -> List[int]:
     """Find section boundaries based on comment patterns.
     
+    The whole source is scanned once with the combined boundary pattern;
+    line numbers are tracked by counting newlines between matches.
+    
     Args:
-        lines: Source code lines
+        source_code: Source code to scan
         
     Returns:
-        Line numbers of section boundaries
+        Line numbers of section boundaries, in ascending order
     """
     boundaries = []
-    for i, line in enumerate(lines):
-        for pattern in COMPILED_BOUNDARY_PATTERNS:
-            if pattern.match(line):
-                boundaries.append(i)
+    line = 0
+    position = 0
+    for match in COMBINED_BOUNDARY_RE.finditer(source_code):
+        line += source_code.count('\n', position, match.start())
+        position = match.start()
+        boundaries.append(line)
     return boundaries
 
 
-def _find_definition_boundaries(tree: ast.AST) -> List[int]:
+def _find_definition_boundaries(tree: ast.Module) -> List[int]:
     """Find class and function definition boundaries.
     
     Args:
         tree: AST of source code
         
     Returns:
-        Line numbers of definition boundaries
+        Line numbers of definition boundaries, in ascending order
     """
-    class_funcs = []
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.ClassDef, ast.FunctionDef)) and not node.name.startswith('_'):
-            # Check if this is a top-level definition
-            if isinstance(ast.iter_fields(tree), ast.Module) or any(
-                isinstance(parent, ast.Module) for parent in ast.iter_ancestors(node)
-            ):
-                class_funcs.append(node.lineno - 1)  # Convert to 0-based index
-    return class_funcs
+    # Only top-level definitions mark boundaries, so the module body is enough
+    return [
+        node.lineno - 1  # Convert to 0-based index
+        for node in tree.body
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef)) and not node.name.startswith('_')
+    ]
 
 
 def _group_related_boundaries(boundaries: List[int], proximity_threshold: int = 10) -> List[List[int]]:
@@ -87,93 +110,115 @@ def _group_related_boundaries(boundaries: List[int], proximity_threshold: int =
     Returns:
         Grouped boundaries forming coherent modules
     """
-    grouped = []
-    current_group = []
+    if not boundaries:
+        return []
     
-    for boundary in boundaries:
-        if not current_group or boundary - current_group[-1] < proximity_threshold:
-            current_group.append(boundary)
-        else:
-            grouped.append(current_group)
-            current_group = [boundary]
+    # Split wherever the gap to the previous boundary reaches the threshold
+    breaks = [
+        index for index, (previous, boundary) in enumerate(pairwise(boundaries), 1)
+        if boundary - previous >= proximity_threshold
+    ]
+    return [boundaries[start:end] for start, end in pairwise([0, *breaks, len(boundaries)])]
+
+
+def _build_line_index(source_code: str) -> Tuple[List[int], List[bool], List[bool]]:
+    """Index every line of the source once for boundary expansion.
     
-    if current_group:
-        grouped.append(current_group)
+    Args:
+        source_code: Source code to index
+        
+    Returns:
+        Tuple of (line start offsets, boundary flags, blank flags) per line.
+        The offsets end with a sentinel one past the end of the source, so
+        line ``i`` always spans ``line_starts[i]:line_starts[i + 1] - 1``
+    """
+    line_starts = [0]
+    position = source_code.find('\n')
+    while position != -1:
+        line_starts.append(position + 1)
+        position = source_code.find('\n', position + 1)
     
-    return grouped
+    def flag_lines(pattern: re.Pattern) -> List[bool]:
+        flags = [False] * len(line_starts)
+        for match in pattern.finditer(source_code):
+            flags[bisect.bisect_right(line_starts, match.start()) - 1] = True
+        return flags
+    
+    is_boundary = flag_lines(_INDENTED_BOUNDARY_RE)
+    is_blank = flag_lines(_BLANK_LINE_RE)
+    line_starts.append(len(source_code) + 1)
+    return line_starts, is_boundary, is_blank
 
 
-def _create_module_definitions(grouped_boundaries: List[List[int]], lines: List[str]) -> List[Dict[str, Any]]:
+def _create_module_definitions(grouped_boundaries: List[List[int]], source_code: str) -> List[ModuleInfo]:
     """Create module definitions from grouped boundaries.
     
     Args:
         grouped_boundaries: Grouped line numbers forming modules
-        lines: Source code lines
+        source_code: Source code the boundaries refer to
         
     Returns:
         List of module definitions with content and boundaries
     """
     modules = []
+    line_starts, is_boundary, is_blank = _build_line_index(source_code)
+    
+    # Two blank lines in a row often indicate a section break
+    is_break = [blank and next_blank for blank, next_blank in zip(is_blank, is_blank[1:])] + [False]
     
     for i, group in enumerate(grouped_boundaries):
         start_line = group[0]
         end_line = group[-1]
         
         # Expand to include associated code
-        start_line = _find_module_start(start_line, lines)
-        end_line = _find_module_end(end_line, lines)
+        start_line = _find_module_start(start_line, is_boundary, is_blank)
+        end_line = _find_module_end(end_line, is_boundary, is_break)
         
-        # Extract module name and code
-        content = '\n'.join(lines[start_line:end_line + 1])
+        # Extract module name and code as one slice of the source
+        content = source_code[line_starts[start_line]:line_starts[end_line + 1] - 1]
         name = _extract_module_name(content, f"module_{i}")
         
-        modules.append({
-            "name": name,
-            "start_line": start_line,
-            "end_line": end_line,
-            "content": content
-        })
+        modules.append(ModuleInfo(
+            name=name,
+            start_line=start_line,
+            end_line=end_line,
+            content=content
+        ))
     
     return modules
 
 
-def _find_module_start(start_line: int, lines: List[str]) -> int:
+def _find_module_start(start_line: int, is_boundary: List[bool], is_blank: List[bool]) -> int:
     """Find the actual start of a module, considering preceding blank/comment lines.
     
     Args:
         start_line: Initial start line
-        lines: Source code lines
+        is_boundary: Per-line boundary pattern flags
+        is_blank: Per-line blank flags
         
     Returns:
         Adjusted start line
     """
-    while start_line > 0:
-        prev_line = lines[start_line - 1].strip()
-        # Stop if we hit a boundary pattern or blank line after content
-        if not prev_line or any(pattern.match(prev_line) for pattern in COMPILED_BOUNDARY_PATTERNS):
-            break
+    # Stop if we hit a boundary pattern or blank line after content
+    while start_line > 0 and not is_blank[start_line - 1] and not is_boundary[start_line - 1]:
         start_line -= 1
     return start_line
 
 
-def _find_module_end(end_line: int, lines: List[str]) -> int:
+def _find_module_end(end_line: int, is_boundary: List[bool], is_break: List[bool]) -> int:
     """Find the actual end of a module, considering trailing code.
     
     Args:
         end_line: Initial end line
-        lines: Source code lines
+        is_boundary: Per-line boundary pattern flags
+        is_break: Per-line flags marking the first of two blank lines
         
     Returns:
         Adjusted end line
     """
-    while end_line < len(lines) - 1:
-        next_line = lines[end_line + 1].strip()
-        # Stop if we hit a boundary pattern
-        if any(pattern.match(next_line) for pattern in COMPILED_BOUNDARY_PATTERNS):
-            break
-        if not next_line and end_line + 2 < len(lines) and not lines[end_line + 2].strip():
-            # Two blank lines often indicate a section break
-            break
+    # Stop if we hit a boundary pattern or a section break
+    last_line = len(is_boundary) - 1
+    while end_line < last_line and not is_boundary[end_line + 1] and not is_break[end_line + 1]:
         end_line += 1
     return end_line
 
@@ -189,19 +234,19 @@ def _extract_module_name(content: str, default: str) -> str:
         Extracted module name
     """
     # Try to find a class name
-    class_match = re.search(r"class ([A-Z][a-zA-Z0-9_]*)", content)
+    class_match = _CLASS_NAME_RE.search(content)
     if class_match:
         return class_match.group(1).lower()
     
     # Look for section headers
-    header_match = re.search(r"# [│╭╰][ ]*([A-Za-z ]+?)[ ]*[│╮╯]", content)
+    header_match = _HEADER_RE.search(content)
     if header_match:
         # Convert "Section Name" to "section_name"
         section_name = header_match.group(1).strip().lower().replace(' ', '_')
         return section_name
     
     # Look for main function
-    func_match = re.search(r"def ([a-z][a-zA-Z0-9_]*)\(", content)
+    func_match = _FUNC_NAME_RE.search(content)
     if func_match:
         return func_match.group(1)
     
@@ -16,10 +16,9 @@ from typing import Optional, List, Dict, Any, Union
 
 from . import __version__
 from .core.types import AnalysisResult, TransformationResult, RefactorOptions
-from .analyzer import analyze_code
-from .reporter import print_analysis_report
-from .transformer import transform_code
-from .transformer.filesystem import generate_files
+
+# The analyzer, reporter and transformer are imported where they are used,
+# so --help, --version and argument errors exit without loading them
 
 # ╭──────────────────────────────────────────────────────╮
 # │  🎮 Command Interface - Argument Processing          │
@@ -77,6 +76,18 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         help="Clean output directory before generating files"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-analyze the source instead of reusing cached results"
+    )
+    
+    parser.add_argument(
+        "--warmup",
+        action="store_true",
+        help="Warm up the analyzer on a small built-in sample first (useful under PyPy)"
+    )
+    
     parser.add_argument(
         "--version",
         action="version",
@@ -102,6 +113,11 @@ def main(args: Optional[List[str]] = None) -> int:
     parsed_args = parse_args(args)
     
     try:
+        # Give a JIT the chance to compile the hot analysis paths first
+        if parsed_args.warmup:
+            from .analyzer import warm_up
+            warm_up()
+        
         # Convert CLI args to options object
         options = RefactorOptions(
             source_path=parsed_args.source,
@@ -109,7 +125,8 @@ def main(args: Optional[List[str]] = None) -> int:
             package_name=parsed_args.package_name,
             analyze_only=parsed_args.analyze_only,
             dry_run=parsed_args.dry_run,
-            verbose=parsed_args.verbose
+            verbose=parsed_args.verbose,
+            use_cache=not parsed_args.no_cache
         )
         
         # Execute the refactoring process
@@ -144,8 +161,11 @@ def execute_refactoring(
     if not source_path.exists():
         raise FileNotFoundError(f"Source file not found: {source_path}")
     
+    from .analyzer import analyze_code
+    from .reporter import print_analysis_report
+    
     print(f"🔍 Analyzing {source_path}...")
-    analysis_results = analyze_code(source_path)
+    analysis_results = analyze_code(source_path, use_cache=options.use_cache)
     
     if options.analyze_only or options.dry_run or options.verbose:
         print_analysis_report(analysis_results)
@@ -153,6 +173,9 @@ def execute_refactoring(
     if options.analyze_only:
         return {"success": True, "analysis": analysis_results}
     
+    from .transformer import transform_code
+    from .transformer.filesystem import generate_files
+    
     print(f"🔮 Transforming {source_path}...")
     transform_results = transform_code(
         analysis_results, 
@@ -196,7 +219,8 @@ def refactor(
     analyze_only: bool = False,
     dry_run: bool = False,
     verbose: bool = False,
-    clean: bool = False
+    clean: bool = False,
+    use_cache: bool = True
 ) -> Dict[str, Any]:
     """High-level API for programmatic refactoring - maintains full compatibility.
     
@@ -208,6 +232,7 @@ def refactor(
         dry_run: Show what would be done without making changes
         verbose: Enable verbose output
         clean: Whether to clean output directory first
+        use_cache: Whether to reuse cached analysis results
         
     Returns:
         Dict containing analysis and transformation results
@@ -216,12 +241,13 @@ def refactor(
         FileNotFoundError: If source file doesn't exist
     """
     options = RefactorOptions(
-        source_path=source_path,
+        source_path=str(source_path),
         output_dir=output_dir,
         package_name=package_name,
         analyze_only=analyze_only,
         dry_run=dry_run,
-        verbose=verbose
+        verbose=verbose,
+        use_cache=use_cache
     )
     
     return execute_refactoring(options, clean=clean)
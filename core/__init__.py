@@ -6,4 +6,4 @@ the Eidosian Refactor system. This module serves as the atomic foundation
 upon which all other modules are constructed.
 """
 
-__all__ = ["types", "utils", "config"]
+__all__ = ["types", "utils", "config", "graph"]
@@ -27,6 +27,11 @@ MODULE_BOUNDARY_PATTERNS = [
 # Compiled patterns for efficiency
 COMPILED_BOUNDARY_PATTERNS = [re.compile(pattern) for pattern in MODULE_BOUNDARY_PATTERNS]
 
+# All boundary patterns fused into one line-anchored alternation for single-pass scans
+COMBINED_BOUNDARY_RE: Pattern = re.compile(
+    "(?m)^(?:" + "|".join(f"(?:{pattern.pattern})" for pattern in COMPILED_BOUNDARY_PATTERNS) + ")"
+)
+
 # Semantic indicators for module purpose inference
 MODULE_PURPOSE_INDICATORS: Dict[str, List[str]] = {
     "util": ["utility", "helper", "tool", "common"],
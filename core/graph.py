@@ -0,0 +1,169 @@
+"""
+Graph - Lightweight Dependency Structure 🕸️
+
+Provides a minimal directed graph for module dependency mapping.
+Implements only the small subset of the NetworkX ``DiGraph`` interface the
+system relies on, backed by plain adjacency dicts for fast construction
+and zero import overhead.
+"""
+
+from typing import Any, Dict, Generic, Hashable, Iterable, Iterator, List, Mapping, Set, Tuple, TypeVar
+
+# Node type of a graph, kept by the algorithms so callers get their own keys back
+NodeT = TypeVar("NodeT", bound=Hashable)
+
+# ╭──────────────────────────────────────────────────────╮
+# │  🕸️ Directed Graph - Adjacency Mapping               │
+# ╰──────────────────────────────────────────────────────╯
+
+class DiGraph(Generic[NodeT]):
+    """Directed graph stored as an insertion-ordered adjacency mapping.
+
+    Successors are kept in dicts used as ordered sets, so iteration order
+    is deterministic and matches the order edges were added. Generic over
+    the node type, so callers get their own node keys back.
+    """
+
+    __slots__ = ("_nodes", "_succ")
+
+    def __init__(self) -> None:
+        """Initialize an empty graph."""
+        self._nodes: Dict[NodeT, Dict[str, Any]] = {}
+        self._succ: Dict[NodeT, Dict[NodeT, None]] = {}
+
+    def add_node(self, node: NodeT, **attrs: Any) -> None:
+        """Add a node, updating its attributes if it already exists.
+
+        Args:
+            node: Node identifier
+            **attrs: Attributes to attach to the node
+        """
+        self._nodes.setdefault(node, {}).update(attrs)
+        self._succ.setdefault(node, {})
+
+    def add_edge(self, source: NodeT, target: NodeT) -> None:
+        """Add a directed edge, creating missing endpoints.
+
+        Args:
+            source: Node the edge starts from
+            target: Node the edge points to
+        """
+        if source not in self._succ:
+            self.add_node(source)
+        if target not in self._succ:
+            self.add_node(target)
+        self._succ[source][target] = None
+
+    def nodes(self) -> List[NodeT]:
+        """Return all nodes in insertion order."""
+        return list(self._succ)
+
+    def node_attributes(self, node: NodeT) -> Dict[str, Any]:
+        """Return the attribute dict attached to a node.
+
+        Raises:
+            KeyError: If the node is not in the graph
+        """
+        return self._nodes[node]
+
+    def successors(self, node: NodeT) -> Iterator[NodeT]:
+        """Iterate over the direct successors of a node.
+
+        Raises:
+            KeyError: If the node is not in the graph
+        """
+        return iter(self._succ[node])
+
+    def out_edges(self, node: NodeT) -> List[Tuple[NodeT, NodeT]]:
+        """Return the outgoing edges of a node as (source, target) pairs.
+
+        Raises:
+            KeyError: If the node is not in the graph
+        """
+        return [(node, target) for target in self._succ[node]]
+
+    def has_edge(self, source: NodeT, target: NodeT) -> bool:
+        """Check whether a directed edge exists."""
+        return target in self._succ.get(source, ())
+
+    def number_of_nodes(self) -> int:
+        """Return the number of nodes."""
+        return len(self._succ)
+
+    def number_of_edges(self) -> int:
+        """Return the number of edges."""
+        return sum(len(targets) for targets in self._succ.values())
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._succ
+
+    def __len__(self) -> int:
+        return len(self._succ)
+
+    def __iter__(self) -> Iterator[NodeT]:
+        return iter(self._succ)
+
+
+# ╭──────────────────────────────────────────────────────╮
+# │  🔁 Cycle Detection - Strongly Connected Components  │
+# ╰──────────────────────────────────────────────────────╯
+
+def strongly_connected_components(
+    adjacency: Mapping[NodeT, Iterable[NodeT]]
+) -> List[List[NodeT]]:
+    """Find the strongly connected components of a directed graph.
+
+    Iterative Tarjan's algorithm, so deep graphs cannot exhaust the
+    recursion limit; runs in O(V + E). Every component with more than one
+    node, or a single node with a self-loop, contains a cycle.
+
+    Args:
+        adjacency: Mapping of each node to its successors; successors
+            missing from the mapping are treated as having none
+
+    Returns:
+        Components in reverse topological order, each a list of nodes
+    """
+    index: Dict[NodeT, int] = {}
+    lowlink: Dict[NodeT, int] = {}
+    stack: List[NodeT] = []
+    on_stack: Set[NodeT] = set()
+    components: List[List[NodeT]] = []
+
+    for root in adjacency:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work: List[Tuple[NodeT, Iterator[NodeT]]] = [(root, iter(adjacency.get(root, ())))]
+
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index:
+                    # Descend; the node's iterator resumes when we return
+                    index[successor] = lowlink[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(adjacency.get(successor, ()))))
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[successor])
+            else:
+                # All successors visited: propagate the lowlink to the parent
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component: List[NodeT] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
@@ -5,6 +5,7 @@ Provides precise type definitions for all data structures used throughout
 the Eidosian Refactor system, ensuring type safety and clarity.
 """
 
+import ast
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Union, Any, TypedDict
@@ -13,15 +14,24 @@ from typing import Dict, List, Set, Optional, Union, Any, TypedDict
 # │  🏗️ Core Data Structures - Foundational Types       │
 # ╰──────────────────────────────────────────────────────╯
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RefactorOptions:
-    """Options for controlling the refactoring process."""
-    source_path: Union[str, Path]
+    """Options for controlling the refactoring process.
+    
+    Immutable and hashable; ``source_path`` is stored as ``str`` so equal
+    paths hash alike, and a ``Path`` given for it is converted on creation.
+    Use ``dataclasses.replace`` to derive changed options.
+    """
+    source_path: str
     output_dir: Optional[Union[str, Path]] = None
     package_name: Optional[str] = None
     analyze_only: bool = False
     dry_run: bool = False
     verbose: bool = False
+    use_cache: bool = True
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "source_path", str(self.source_path))
 
 
 class FileInfo(TypedDict):
@@ -32,7 +42,8 @@ class FileInfo(TypedDict):
     stem: str
 
 
-class FunctionInfo(TypedDict):
+@dataclass(slots=True)
+class FunctionInfo:
     """Information about a function."""
     name: str
     lineno: int
@@ -40,7 +51,8 @@ class FunctionInfo(TypedDict):
     docstring: str
 
 
-class ClassInfo(TypedDict):
+@dataclass(slots=True)
+class ClassInfo:
     """Information about a class."""
     name: str
     lineno: int
@@ -48,22 +60,28 @@ class ClassInfo(TypedDict):
     docstring: str
 
 
-class ModuleInfo(TypedDict, total=False):
-    """Information about an identified module."""
+@dataclass(slots=True)
+class ModuleInfo:
+    """Information about an identified module.
+    
+    Semantic fields are filled in by the semantic pass; ``tree`` caches the
+    module's AST for the analysis passes and is left out of comparisons.
+    """
     name: str
     start_line: int
     end_line: int
     content: str
-    purpose: str
-    docstring: str
-    functions: List[FunctionInfo]
-    classes: List[ClassInfo]
+    purpose: str = ""
+    docstring: str = ""
+    functions: List[FunctionInfo] = field(default_factory=list)
+    classes: List[ClassInfo] = field(default_factory=list)
+    tree: Optional[ast.Module] = field(default=None, repr=False, compare=False)
 
 
 class AnalysisResult(TypedDict):
     """Results of code analysis."""
     modules: List[ModuleInfo]
-    dependencies: Any  # NetworkX graph
+    dependencies: Any  # core.graph.DiGraph
     symbols: Dict[str, Dict[str, Any]]
     file_info: FileInfo
 
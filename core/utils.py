@@ -5,14 +5,26 @@ Provides essential utility functions used throughout the Eidosian Refactor syste
 Each function is atomic, focused, and optimized for its specific purpose.
 """
 
+import ast
+import mmap
 import re
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import Callable, List, Dict, Any, Optional, Set, Tuple, Union
+
+# Character classes for case conversion and the indentation pattern, built once.
+# The pure string helpers below are also memoized, as the same identifiers
+# are converted repeatedly while naming modules and files
+_ASCII_UPPERCASE = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_WORD_SEPARATORS = frozenset(' -_')
+_INDENT_RE = re.compile(r'^(\s*)')
 
 # ╭──────────────────────────────────────────────────────╮
 # │  📝 String Processing - Text Manipulation            │
 # ╰──────────────────────────────────────────────────────╯
 
+@lru_cache(maxsize=4096)
 def to_snake_case(text: str) -> str:
     """Convert text to snake_case with precision and elegance.
     
@@ -22,14 +34,23 @@ def to_snake_case(text: str) -> str:
     Returns:
         Text in snake_case format
     """
-    # Handle camelCase and PascalCase
-    s1 = re.sub(r'([A-Z])', r'_\1', text)
-    # Handle spaces, hyphens, etc.
-    s2 = re.sub(r'[ \-]+', '_', s1)
-    # Handle consecutive underscores and ensure lowercase
-    return re.sub(r'_+', '_', s2).strip('_').lower()
+    out: List[str] = []
+    append = out.append
+    for char in text:
+        if char in _WORD_SEPARATORS:
+            # Handle spaces, hyphens and consecutive underscores
+            if out and out[-1] != '_':
+                append('_')
+            continue
+        if char in _ASCII_UPPERCASE and out and out[-1] != '_':
+            # Handle camelCase and PascalCase
+            append('_')
+        append(char)
+    # Ensure lowercase
+    return ''.join(out).strip('_').lower()
 
 
+@lru_cache(maxsize=4096)
 def to_pascal_case(text: str) -> str:
     """Convert text to PascalCase with elegant capitalization.
     
@@ -45,6 +66,7 @@ def to_pascal_case(text: str) -> str:
     return ''.join(word.capitalize() for word in snake.split('_'))
 
 
+@lru_cache(maxsize=4096)
 def extract_indentation(line: str) -> str:
     """Extract leading indentation from a line of text.
     
@@ -54,9 +76,158 @@ def extract_indentation(line: str) -> str:
     Returns:
         Leading indentation (spaces/tabs)
     """
-    match = re.match(r'^(\s*)', line)
+    match = _INDENT_RE.match(line)
     return match.group(1) if match else ''
 
+# ╭──────────────────────────────────────────────────────╮
+# │  🌳 Parsing - Shared Syntax Trees                    │
+# ╰──────────────────────────────────────────────────────╯
+
+@lru_cache(maxsize=64)
+def parse_cached(source: str) -> ast.Module:
+    """Parse source code, reusing the tree when the same text is parsed again.
+    
+    Trees are shared between callers, so they must be treated as read-only.
+    
+    Args:
+        source: Python source code
+        
+    Returns:
+        Parsed module AST
+    """
+    return ast.parse(source)
+
+
+# Callbacks of the type-dispatched walk: a handler records the names of a
+# node it is registered for by passing them to the sink
+NameSink = Callable[[str], None]
+NameHandler = Callable[[Any, NameSink], None]
+
+
+def collect_names(tree: ast.AST, handlers: Dict[type, NameHandler]) -> Set[str]:
+    """Walk the AST with an explicit stack, dispatching on exact node type.
+    
+    Hot lookups are bound to locals and child nodes are pushed straight
+    from ``_fields``, so the loop body avoids the two nested generators
+    ``ast.iter_child_nodes`` would create per node.
+    
+    Args:
+        tree: AST to walk
+        handlers: Mapping of node type to the handler that records its names
+        
+    Returns:
+        Set of names recorded by the handlers
+    """
+    names: Set[str] = set()
+    add = names.add
+    stack = [tree]
+    pop = stack.pop
+    push = stack.append
+    handler_for = handlers.get
+    node_type = ast.AST
+    
+    while stack:
+        node = pop()
+        
+        handler = handler_for(type(node))
+        if handler is not None:
+            handler(node, add)
+        
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, node_type):
+                        push(item)
+            elif isinstance(value, node_type):
+                push(value)
+    
+    return names
+
+
+# ╭──────────────────────────────────────────────────────╮
+# │  🔎 Keyword Matching - Aho–Corasick Automaton        │
+# ╰──────────────────────────────────────────────────────╯
+
+# Groups in priority order, goto transitions, failure links, and the rank of
+# the highest-priority group whose keyword ends at each state (-1 for none)
+KeywordAutomaton = Tuple[List[str], List[Dict[str, int]], List[int], List[int]]
+
+
+def build_keyword_automaton(groups: Dict[str, List[str]]) -> KeywordAutomaton:
+    """Compile keyword groups into an Aho–Corasick automaton.
+    
+    Groups rank by their order in the mapping, first being highest.
+    
+    Args:
+        groups: Mapping of group name to its keyword substrings
+        
+    Returns:
+        Automaton for ``match_keyword_group``
+    """
+    goto: List[Dict[str, int]] = [{}]
+    output: List[int] = [-1]
+    
+    # Build the keyword trie
+    for rank, keywords in enumerate(groups.values()):
+        for keyword in keywords:
+            state = 0
+            for char in keyword:
+                if char not in goto[state]:
+                    goto.append({})
+                    output.append(-1)
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            if output[state] == -1 or rank < output[state]:
+                output[state] = rank
+    
+    # Breadth-first failure links, folding suffix outputs into each state
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, child in goto[state].items():
+            queue.append(child)
+            link = fail[state]
+            while link and char not in goto[link]:
+                link = fail[link]
+            fail[child] = goto[link].get(char, 0)
+            inherited = output[fail[child]]
+            if inherited != -1 and (output[child] == -1 or inherited < output[child]):
+                output[child] = inherited
+    
+    return list(groups), goto, fail, output
+
+
+def match_keyword_group(automaton: KeywordAutomaton, text: str) -> Optional[str]:
+    """Find the highest-priority group with a keyword anywhere in the text.
+    
+    Scans the text once, whatever the number of keywords.
+    
+    Args:
+        automaton: Automaton from ``build_keyword_automaton``
+        text: Text to scan
+        
+    Returns:
+        Name of the matching group, or None if no keyword occurs
+    """
+    names, goto, fail, output = automaton
+    state = 0
+    best = -1
+    
+    for char in text:
+        while state and char not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(char, 0)
+        rank = output[state]
+        if rank != -1 and (best == -1 or rank < best):
+            best = rank
+            if best == 0:
+                break
+    
+    return names[best] if best != -1 else None
+
+
 # ╭──────────────────────────────────────────────────────╮
 # │  📂 File Operations - Path Handling                  │
 # ╰──────────────────────────────────────────────────────╯
@@ -75,6 +246,27 @@ def ensure_directory(path: Union[str, Path]) -> Path:
     return path_obj
 
 
+def map_source(path: Union[str, Path]) -> Union[mmap.mmap, bytes]:
+    """Memory-map a source file read-only instead of reading it eagerly.
+    
+    The OS page cache backs the returned buffer, so only touched pages are
+    loaded. ``ast.parse`` and ``str(buffer, encoding)`` both accept it directly.
+    
+    Args:
+        path: Path to source file
+        
+    Returns:
+        Read-only mapping of the file, or empty bytes for an empty file
+    """
+    with open(path, 'rb') as source_file:
+        try:
+            return mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Zero-length files cannot be mapped
+            return b""
+
+
+@lru_cache(maxsize=4096)
 def derive_package_name(source_path: Union[str, Path]) -> str:
     """Derive a suitable package name from a source file path.
     
@@ -98,6 +290,12 @@ def derive_output_dir(source_path: Union[str, Path], package_name: Optional[str]
     Returns:
         Path to output directory
     """
+    return _derive_output_dir_cached(str(source_path), package_name)
+
+
+@lru_cache(maxsize=4096)
+def _derive_output_dir_cached(source_path: str, package_name: Optional[str]) -> Path:
+    # Keyed on the path string so str and Path arguments share cache entries
     source_dir = Path(source_path).parent
     pkg_name = package_name or derive_package_name(source_path)
     return source_dir / pkg_name
@@ -5,87 +5,95 @@ Renders analysis results in human-friendly formats with precise
 information layout and visual enhancements for clarity.
 """
 
+import sys
+from collections import defaultdict
 from typing import Dict, Any, List, Optional
-import networkx as nx
 import textwrap
 
+from .core.graph import DiGraph
+from .core.types import ModuleInfo
+
 
 def print_analysis_report(results: Dict[str, Any]) -> None:
     """Print a human-readable report from analysis results.
     
+    The report is assembled in memory and written to stdout in one call.
+    
     Args:
         results: Analysis results from analyze_code()
     """
-    print(f"📊 Analysis Report for {results['file_info']['path']}")
-    print(f"Found {len(results['modules'])} potential modules:")
+    out: List[str] = []
+    out.append(f"📊 Analysis Report for {results['file_info']['path']}\n")
+    out.append(f"Found {len(results['modules'])} potential modules:\n")
+    
+    # Render modules information
+    _render_modules_summary(results['modules'], out)
     
-    # Print modules information
-    _print_modules_summary(results['modules'])
+    # Render dependency graph
+    if isinstance(results['dependencies'], DiGraph) and results['dependencies'].number_of_edges() > 0:
+        _render_dependency_graph(results['dependencies'], out)
     
-    # Print dependency graph
-    if isinstance(results['dependencies'], nx.DiGraph) and results['dependencies'].number_of_edges() > 0:
-        _print_dependency_graph(results['dependencies'])
+    # Render import information
+    _render_import_summary(results['symbols'], out)
     
-    # Print import information
-    _print_import_summary(results['symbols'])
+    sys.stdout.write("".join(out))
 
 
-def _print_modules_summary(modules: List[Dict[str, Any]]) -> None:
-    """Print summary information for all detected modules.
+def _render_modules_summary(modules: List[ModuleInfo], out: List[str]) -> None:
+    """Render summary information for all detected modules.
     
     Args:
-        modules: List of module dictionaries from analysis
+        modules: List of modules from analysis
+        out: Report lines to append to
     """
     for i, module in enumerate(modules, 1):
-        print(f"\n{i}. {module['name']}")
-        print(f"   Purpose: {module.get('purpose', 'Unknown purpose')}")
-        print(f"   Lines: {module['start_line']+1}-{module['end_line']+1}")
+        out.append(f"\n{i}. {module.name}\n")
+        out.append(f"   Purpose: {module.purpose or 'Unknown purpose'}\n")
+        out.append(f"   Lines: {module.start_line+1}-{module.end_line+1}\n")
         
-        functions = module.get('functions', [])
-        if functions:
-            print(f"   Functions: {', '.join(f['name'] for f in functions)}")
+        if module.functions:
+            out.append(f"   Functions: {', '.join(f.name for f in module.functions)}\n")
         
-        classes = module.get('classes', [])
-        if classes:
-            print(f"   Classes: {', '.join(c['name'] for c in classes)}")
+        if module.classes:
+            out.append(f"   Classes: {', '.join(c.name for c in module.classes)}\n")
 
 
-def _print_dependency_graph(dependencies: nx.DiGraph) -> None:
-    """Print a textual representation of the dependency graph.
+def _render_dependency_graph(dependencies: DiGraph[str], out: List[str]) -> None:
+    """Render a textual representation of the dependency graph.
     
     Args:
-        dependencies: NetworkX DiGraph of module dependencies
+        dependencies: DiGraph of module dependencies
+        out: Report lines to append to
     """
-    print("\n⚡ Dependency Graph:")
+    out.append("\n⚡ Dependency Graph:\n")
     
     for module in dependencies.nodes():
         outgoing = list(dependencies.successors(module))
         if outgoing:
-            print(f"   {module} → {', '.join(outgoing)}")
+            out.append(f"   {module} → {', '.join(outgoing)}\n")
         else:
-            print(f"   {module} (no dependencies)")
+            out.append(f"   {module} (no dependencies)\n")
 
 
-def _print_import_summary(symbols: Dict[str, Dict[str, Any]]) -> None:
-    """Print summary of imported symbols.
+def _render_import_summary(symbols: Dict[str, Dict[str, Any]], out: List[str]) -> None:
+    """Render summary of imported symbols.
     
     Args:
         symbols: Symbol table from analysis
+        out: Report lines to append to
     """
     if not symbols:
         return
         
-    print("\n📦 Imports:")
+    out.append("\n📦 Imports:\n")
     
-    import_groups = {}
+    import_groups: Dict[str, List[str]] = defaultdict(list)
     for symbol, info in symbols.items():
-        source = info.get('source', '')
-        if source not in import_groups:
-            import_groups[source] = []
-        import_groups[source].append(symbol)
+        import_groups[info.get('source', '')].append(symbol)
     
     for source, symbols_list in import_groups.items():
+        symbols_list.sort()
         if source:
-            print(f"   From {source}: {', '.join(sorted(symbols_list))}")
+            out.append(f"   From {source}: {', '.join(symbols_list)}\n")
         else:
-            print(f"   Direct imports: {', '.join(sorted(symbols_list))}")
+            out.append(f"   Direct imports: {', '.join(symbols_list)}\n")
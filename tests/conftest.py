@@ -0,0 +1,23 @@
+"""
+Test Configuration - Package Import Bootstrap 🧪
+
+Makes the repository importable as a package for the test suite, under
+the name of its checkout directory.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+if str(ROOT.parent) not in sys.path:
+    sys.path.insert(0, str(ROOT.parent))
+
+
+@pytest.fixture(scope="session")
+def package():
+    """Import the repository package by its directory name."""
+    return importlib.import_module(ROOT.name)
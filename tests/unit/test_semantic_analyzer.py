@@ -0,0 +1,67 @@
+"""
+Semantic Analyzer Tests - Serial and Parallel Agreement 🧪
+
+Checks that the worker pool path of semantic extraction reports the same
+results as the serial path.
+"""
+
+import ast
+import importlib
+import os
+
+import pytest
+
+# A module boundary found at two blank lines can fall inside an open
+# statement, leaving the module's content invalid as source on its own
+TRUNCATED_SOURCE = '''def alpha(a):
+    """Pair a value."""
+    value = (a,
+
+
+             1)
+    return value
+
+
+class Beta:
+    def __init__(self):
+        self.value = alpha(1)
+'''
+TRUNCATED_CONTENT = 'def alpha(a):\n    """Pair a value."""\n    value = (a,\n'
+
+
+@pytest.fixture
+def semantic_analyzer(package):
+    return importlib.import_module(f"{package.__name__}.analyzer.semantic_analyzer")
+
+
+def _truncated_modules(package):
+    types = importlib.import_module(f"{package.__name__}.core.types")
+    tree = ast.parse(TRUNCATED_SOURCE)
+    return [
+        types.ModuleInfo(
+            name=f"module_{index}",
+            start_line=0,
+            end_line=2,
+            content=TRUNCATED_CONTENT,
+            tree=ast.Module(body=tree.body[:1], type_ignores=[]),
+        )
+        for index in range(4)
+    ]
+
+
+def test_truncated_module_is_not_valid_source():
+    with pytest.raises(SyntaxError):
+        ast.parse(TRUNCATED_CONTENT)
+
+
+def test_parallel_matches_serial_on_truncated_module(package, semantic_analyzer, monkeypatch):
+    serial = semantic_analyzer.extract_semantic_purpose(_truncated_modules(package))
+    
+    # Force the worker pool path for a handful of modules
+    monkeypatch.setattr(semantic_analyzer, "_PARALLEL_THRESHOLD", 1)
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    parallel = semantic_analyzer.extract_semantic_purpose(_truncated_modules(package))
+    
+    assert parallel == serial
+    assert [info.name for info in parallel[0].functions] == ["alpha"]
+    assert parallel[0].purpose == "Pair a value."
@@ -11,9 +11,12 @@ Usage: python tools/version_update.py X.Y.Z
 import re
 import sys
 import os
+import mmap
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any, Set
+from typing import List, Dict, Tuple, Optional, Any, Iterator
 
 
 # ╭──────────────────────────────────────────────────────╮
@@ -28,7 +31,9 @@ CURRENT_DATE = datetime.date.today().isoformat()
 DATE_FORMAT = "%Y-%m-%d"  # ISO format: YYYY-MM-DD
 FORMATTED_DATE = "2025-03-12"  # Today's date as specified
 
-# Pattern configurations for various file types
+# Pattern configurations for various file types. Each table is compiled on
+# first use by compiled_file_patterns, so a run only compiles the patterns
+# of the file types it actually meets
 FILE_PATTERNS = {
     # Python file version patterns
     ".py": {
@@ -54,35 +59,109 @@ FILE_PATTERNS = {
         "version": r'(\s+version:\s*)([0-9.]+)',
         "date": r'(\s+date:\s*)([0-9-]+)',
     },
-    ".yaml": {
-        "version": r'(\s+version:\s*)([0-9.]+)',
-        "date": r'(\s+date:\s*)([0-9-]+)',
-    }
 }
+FILE_PATTERNS[".yaml"] = FILE_PATTERNS[".yml"]
+
+# Version tag blocks and the patterns rewritten inside them, compiled on
+# first use; replacement templates take the new version and date through
+# str.format. Each pattern can only match a block containing one of its
+# literal markers, so the cheap substring test gates the regex scan
+VERSION_BLOCK_PATTERN = re.compile(f"{VERSION_TAG_START}(.*?){VERSION_TAG_END}", re.DOTALL)
+BLOCK_PATTERNS = [
+    (r'__version__\s*=\s*[\'"]([^\'"]+)[\'"]', '__version__ = "{version}"', ("__version__",)),
+    (r'version\s*=\s*"([^"]+)"', 'version = "{version}"', ("version",)),
+    (r'version\s*=\s*\'([^\']+)\'', "version = '{version}'", ("version",)),
+    (r'(Current version:)\s*([0-9.]+)', '\\1 {version}', ("Current version:",)),
+    (r'(Last updated:)\s*([0-9-]+)', '\\1 {date}', ("Last updated:",)),
+    # Update version in version badge
+    (r'(\!\[Version\]\()https://img\.shields\.io/badge/version-([0-9.]+)', '\\1https://img.shields.io/badge/version-{version}', ("![Version](",)),
+    # Update dates
+    (r'(Last updated|Updated on|Date:)(\s*:?\s*)([0-9]{4}-[0-9]{2}-[0-9]{2})', '\\1\\2{date}', ("Last updated", "Updated on", "Date:")),
+]
+
+# Byte markers one of which any updatable file must contain: "version"
+# occurs in every version pattern, the tag in every version block
+VERSION_MARKERS = (b"version", VERSION_TAG_START.encode())
+
+# Discovery and validation patterns
+VERSION_MARKER_PATTERN = re.compile(rb"__version__|# Version:|VERSION_TAG")
+SEMVER_PATTERN = re.compile(r"^\d+\.\d+\.\d+(-[0-9A-Za-z-]+)?(\+[0-9A-Za-z-]+)?$")
+
+
+@lru_cache(maxsize=None)
+def compiled_file_patterns(suffix: str) -> Dict[str, re.Pattern]:
+    """Compile the version patterns of a file type once per process.
+    
+    Args:
+        suffix: File suffix with a FILE_PATTERNS entry
+        
+    Returns:
+        Dictionary mapping pattern types to compiled patterns
+    """
+    return {pattern_type: re.compile(pattern) for pattern_type, pattern in FILE_PATTERNS[suffix].items()}
+
+
+@lru_cache(maxsize=None)
+def compiled_block_patterns() -> List[Tuple[re.Pattern, str, Tuple[str, ...]]]:
+    """Compile the version tag block patterns once per process.
+    
+    Returns:
+        List of (compiled pattern, replacement template, markers) triples
+    """
+    return [(re.compile(pattern), replacement, markers) for pattern, replacement, markers in BLOCK_PATTERNS]
 
 
 # ╭──────────────────────────────────────────────────────╮
 # │  🔄 File Update Functions                            │
 # ╰──────────────────────────────────────────────────────╯
 
-def update_file_version(file_path: Path, new_version: str) -> bool:
+def update_file_version(file_path: Path, new_version: str, preloaded: Optional[bytes] = None) -> bool:
     """Update version in a file based on its type.
     
     Args:
         file_path: Path to file
         new_version: New version string
+        preloaded: File contents already read during discovery, if any
         
     Returns:
         True if updated successfully, False otherwise
     """
-    if not file_path.exists():
-        print(f"Error: {file_path} not found")
-        return False
+    updated, message = _update_file(file_path, new_version, preloaded)
+    print(message)
+    return updated
+
+
+def _update_file(file_path: Path, new_version: str, preloaded: Optional[bytes] = None) -> Tuple[bool, str]:
+    """Update version in a file, returning the report instead of printing it.
     
-    content = file_path.read_text(encoding="utf-8")
+    Args:
+        file_path: Path to file
+        new_version: New version string
+        preloaded: File contents already read during discovery, if any
+        
+    Returns:
+        Tuple of (whether the file was updated, status message)
+    """
+    if preloaded is not None:
+        raw = preloaded
+    elif not file_path.exists():
+        return False, f"Error: {file_path} not found"
+    else:
+        raw = file_path.read_bytes()
     suffix = file_path.suffix.lower()
     updated = False
     
+    # Only version patterns and tag blocks mark a file updated, and both need
+    # a marker; test the raw bytes before paying for decoding and regex scans
+    markers = VERSION_MARKERS if suffix in FILE_PATTERNS else VERSION_MARKERS[1:]
+    if not any(marker in raw for marker in markers):
+        return False, f"ℹ️ No version patterns found in {file_path}"
+    
+    # Decode with the universal newlines read_text would apply
+    content = raw.decode("utf-8")
+    if b"\r" in raw:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    
     # Check for version tag blocks first
     if VERSION_TAG_START in content and VERSION_TAG_END in content:
         updated_content = update_version_tag_block(content, new_version)
@@ -92,25 +171,23 @@ def update_file_version(file_path: Path, new_version: str) -> bool:
     
     # Try file-specific patterns
     if suffix in FILE_PATTERNS:
-        patterns = FILE_PATTERNS[suffix]
+        patterns = compiled_file_patterns(suffix)
         
         for pattern_type, pattern in patterns.items():
             if "date" in pattern_type.lower():
                 # Update date patterns with current date
-                content = re.sub(pattern, lambda m: f'{m.group(1)}{FORMATTED_DATE}{m.group(3) if len(m.groups()) > 2 else ""}', content)
+                content = pattern.sub(lambda m: f'{m.group(1)}{FORMATTED_DATE}{m.group(3) if len(m.groups()) > 2 else ""}', content)
             elif pattern_type == "direct" or "version" in pattern_type.lower():
-                # Update version patterns
-                if len(re.findall(pattern, content)) > 0:  # Check if pattern exists in content
-                    content = re.sub(pattern, lambda m: f'{m.group(1)}{new_version}{m.group(3) if len(m.groups()) > 2 else ""}', content)
+                # Update version patterns, counting matches in the same scan
+                content, count = pattern.subn(lambda m: f'{m.group(1)}{new_version}{m.group(3) if len(m.groups()) > 2 else ""}', content)
+                if count:
                     updated = True
     
     if updated:
         file_path.write_text(content, encoding="utf-8")
-        print(f"✓ Updated {file_path}")
-        return True
+        return True, f"✓ Updated {file_path}"
     else:
-        print(f"ℹ️ No version patterns found in {file_path}")
-        return False
+        return False, f"ℹ️ No version patterns found in {file_path}"
 
 
 def update_version_tag_block(content: str, new_version: str) -> str:
@@ -123,33 +200,24 @@ def update_version_tag_block(content: str, new_version: str) -> str:
     Returns:
         Updated content
     """
-    # Find all blocks between version tags
-    pattern = f"{VERSION_TAG_START}(.*?){VERSION_TAG_END}"
+    replacements = [
+        (pattern, replacement.format(version=new_version, date=FORMATTED_DATE), markers)
+        for pattern, replacement, markers in compiled_block_patterns()
+    ]
     
     def replace_version_in_block(match):
         block = match.group(1)
         
-        # Replace version in common patterns within the block
-        patterns = [
-            (r'__version__\s*=\s*[\'"]([^\'"]+)[\'"]', f'__version__ = "{new_version}"'),
-            (r'version\s*=\s*"([^"]+)"', f'version = "{new_version}"'),
-            (r'version\s*=\s*\'([^\']+)\'', f"version = '{new_version}'"),
-            (r'(Current version:)\s*([0-9.]+)', f'\\1 {new_version}'),
-            (r'(Last updated:)\s*([0-9-]+)', f'\\1 {FORMATTED_DATE}'),
-            # Update version in version badge
-            (r'(\!\[Version\]\()https://img\.shields\.io/badge/version-([0-9.]+)', f'\\1https://img.shields.io/badge/version-{new_version}'),
-        ]
-        
-        for pattern, replacement in patterns:
-            block = re.sub(pattern, replacement, block)
-        
-        # Update dates
-        date_pattern = r'(Last updated|Updated on|Date:)(\s*:?\s*)([0-9]{4}-[0-9]{2}-[0-9]{2})'
-        block = re.sub(date_pattern, f'\\1\\2{FORMATTED_DATE}', block)
+        # Replace version and dates in common patterns within the block,
+        # skipping patterns whose markers the block does not contain
+        for pattern, replacement, markers in replacements:
+            if any(marker in block for marker in markers):
+                block = pattern.sub(replacement, block)
             
         return f"{VERSION_TAG_START}{block}{VERSION_TAG_END}"
     
-    return re.sub(pattern, replace_version_in_block, content, flags=re.DOTALL)
+    # Rewrite all blocks between version tags
+    return VERSION_BLOCK_PATTERN.sub(replace_version_in_block, content)
 
 
 def update_pyproject_version(file_path: Path, new_version: str) -> bool:
@@ -169,14 +237,24 @@ def update_pyproject_version(file_path: Path, new_version: str) -> bool:
 # │  🔎 File Discovery and Validation                    │
 # ╰──────────────────────────────────────────────────────╯
 
-def find_versionable_files(project_root: Path) -> Set[Path]:
+# Directories never searched for versionable files
+SKIPPED_DIRS = frozenset({".git", "node_modules", "__pycache__"})
+
+
+def find_versionable_files(project_root: Path) -> Dict[Path, Optional[bytes]]:
     """Find files that might contain version information.
     
+    The tree is walked once with ``os.scandir``, whose directory entries
+    carry their file type, and each file is dispatched by its suffix.
+    Python files are read to look for markers, and their contents are
+    handed on so the update does not read them again.
+    
     Args:
         project_root: Project root directory
         
     Returns:
-        Set of files to check for versioning
+        Dictionary mapping files to check for versioning to their contents,
+        or None for files that were not read
     """
     # Key project files that definitely need version updates
     key_files = [
@@ -187,38 +265,85 @@ def find_versionable_files(project_root: Path) -> Set[Path]:
         project_root / "CHANGELOG.md",
     ]
     
-    versioned_files = set()
+    versioned_files: Dict[Path, Optional[bytes]] = {}
     
     # Add existing key files
     for file in key_files:
         if file.exists():
-            versioned_files.add(file)
-    
-    # Find all Python files that might have version info
-    for py_file in project_root.rglob("*.py"):
-        # Skip test files and tools except version_update.py
-        if (not py_file.name.startswith("test_") and 
-            not (py_file.name != "version_update.py" and "tools" in str(py_file))):
-            with open(py_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                # Only add files with version patterns
-                if re.search(r"__version__|# Version:|VERSION_TAG", content):
-                    versioned_files.add(py_file)
-    
-    # Add additional documentation files
-    for md_file in project_root.rglob("*.md"):
-        # Skip certain files
-        if md_file.name not in ["CONTRIBUTING.md", "CODE_OF_CONDUCT.md"]:
-            versioned_files.add(md_file)
-    
-    # Add workflow files
-    for workflow_file in (project_root / ".github" / "workflows").glob("*.yml"):
-        if workflow_file.exists():
-            versioned_files.add(workflow_file)
+            versioned_files[file] = None
+    
+    workflows_dir = project_root / ".github" / "workflows"
+    
+    for entry, in_tools in _walk_files(str(project_root)):
+        name = entry.name
+        suffix = os.path.splitext(name)[1]
+        
+        if suffix == ".py":
+            # Skip test files and tools except version_update.py
+            if name.startswith("test_") or (in_tools and name != "version_update.py"):
+                continue
+            # Only add files with version patterns
+            contents = _read_if_versioned(entry.path)
+            if contents is not None:
+                versioned_files[Path(entry.path)] = contents
+        elif suffix == ".md":
+            # Add documentation files, skipping certain ones
+            if name not in ["CONTRIBUTING.md", "CODE_OF_CONDUCT.md"]:
+                versioned_files.setdefault(Path(entry.path), None)
+        elif suffix == ".yml":
+            # Add workflow files; paths are compared as Path objects, which
+            # drop the "./" scandir prefixes entries of a relative root with
+            file_path = Path(entry.path)
+            if file_path.parent == workflows_dir:
+                versioned_files.setdefault(file_path, None)
     
     return versioned_files
 
 
+def _read_if_versioned(path: str) -> Optional[bytes]:
+    """Return a file's contents if it holds a version marker.
+    
+    The file is memory-mapped and searched as bytes, so files without a
+    marker are never copied into memory or decoded.
+    
+    Args:
+        path: Path of the file to check
+        
+    Returns:
+        The file's bytes if it contains a version marker, else None
+    """
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if VERSION_MARKER_PATTERN.search(mapped) is None:
+                    return None
+                return mapped[:]
+        except ValueError:
+            # Zero-length files cannot be mapped and hold no markers
+            return None
+
+
+def _walk_files(root: str) -> Iterator[Tuple[os.DirEntry, bool]]:
+    """Yield every file below a directory, pruning skipped directories.
+    
+    Args:
+        root: Directory to walk
+        
+    Returns:
+        Iterator of (file entry, inside a tools directory) pairs
+    """
+    stack = [(root, False)]
+    while stack:
+        directory, in_tools = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIPPED_DIRS:
+                        stack.append((entry.path, in_tools or entry.name == "tools"))
+                elif entry.is_file():
+                    yield entry, in_tools
+
+
 def validate_version(version: str) -> bool:
     """Validate that version string follows semantic versioning.
     
@@ -229,8 +354,7 @@ def validate_version(version: str) -> bool:
         True if valid, False otherwise
     """
     # Simple semver pattern: X.Y.Z with optional prerelease/build metadata
-    pattern = r"^\d+\.\d+\.\d+(-[0-9A-Za-z-]+)?(\+[0-9A-Za-z-]+)?$"
-    return bool(re.match(pattern, version))
+    return bool(SEMVER_PATTERN.match(version))
 
 
 # ╭──────────────────────────────────────────────────────╮
@@ -258,11 +382,21 @@ def sync_version(new_version: str, project_root: Optional[Path] = None) -> Dict[
     if pyproject_path.exists():
         results[str(pyproject_path)] = update_pyproject_version(pyproject_path, new_version)
     
-    # Find and update all versionable files
-    versionable_files = find_versionable_files(project_root)
-    for file_path in versionable_files:
-        if file_path != pyproject_path:  # Skip if already processed
-            results[str(file_path)] = update_file_version(file_path, new_version)
+    # Find and update all versionable files; files are independent, so they
+    # are updated across a thread pool and the reports printed in order after
+    versionable_files = {
+        file_path: contents for file_path, contents in find_versionable_files(project_root).items()
+        if file_path != pyproject_path  # Skip if already processed
+    }
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = list(executor.map(
+            lambda item: _update_file(item[0], new_version, item[1]), versionable_files.items()
+        ))
+    
+    for file_path, (updated, message) in zip(versionable_files, outcomes):
+        print(message)
+        results[str(file_path)] = updated
     
     return results
 
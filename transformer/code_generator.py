@@ -5,11 +5,13 @@ Generates optimized, modular code structure from analysis results,
 creating a perfectly organized package.
 """
 
+import io
 import os
+import tokenize
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 
-from ..core.types import TransformationFile, TransformationResult
+from ..core.types import ModuleInfo, TransformationFile, TransformationResult
 from ..core.config import (
     MODULE_DOCSTRING_TEMPLATE, 
     PACKAGE_INIT_TEMPLATE,
@@ -17,6 +19,9 @@ from ..core.config import (
     DEFAULT_MODULE_EMOJIS
 )
 
+# Emoji keywords in priority order, materialized once for the per-module scan
+_EMOJI_ITEMS = tuple(DEFAULT_MODULE_EMOJIS.items())
+
 
 def generate_package_structure(
     analysis_results: Dict[str, Any], 
@@ -40,15 +45,18 @@ def generate_package_structure(
     files: List[TransformationFile] = []
     module_map: Dict[str, str] = {}
     
+    # Name of the original file, shared by the package-level files
+    source_basename = os.path.basename(analysis_results['file_info']['path'])
+    
     # Create package level __init__.py
-    init_file = _generate_package_init(analysis_results, package_name)
+    init_file = _generate_package_init(analysis_results, package_name, source_basename)
     files.append({
         "path": str(output_path / "__init__.py"),
         "content": init_file
     })
     
     # Create README
-    readme = _generate_readme(analysis_results, package_name)
+    readme = _generate_readme(analysis_results, package_name, source_basename)
     files.append({
         "path": str(output_path / "README.md"),
         "content": readme
@@ -65,7 +73,7 @@ def generate_package_structure(
             "content": module_file
         })
         
-        module_map[module['name']] = str(module_path.relative_to(output_path))
+        module_map[module.name] = str(module_path.relative_to(output_path))
     
     return {
         "output_path": str(output_path),
@@ -75,30 +83,30 @@ def generate_package_structure(
     }
 
 
-def _generate_package_init(analysis_results: Dict[str, Any], package_name: str) -> str:
+def _generate_package_init(analysis_results: Dict[str, Any], package_name: str, source_basename: str) -> str:
     """Generate the package __init__.py file.
     
     Args:
         analysis_results: Results from code analysis
         package_name: Name of the package
+        source_basename: File name of the original source
         
     Returns:
         Content for __init__.py file
     """
-    source_file = analysis_results['file_info']['path']
-    package_description = f"Modular version of {os.path.basename(source_file)}"
+    package_description = f"Modular version of {source_basename}"
     
-    # Determine exports based on module content
-    exports = []
-    for module in analysis_results['modules']:
-        # For each module that has functions or classes, we'll export them
-        if module.get('functions') or module.get('classes'):
-            mod_name = module['name']
-            exports.append(f"from .{mod_name} import *")
+    # Determine exports based on module content: each module that has
+    # functions or classes gets a star import
+    exports = [
+        f"from .{module.name} import *"
+        for module in analysis_results['modules']
+        if module.functions or module.classes
+    ]
     
     imports_str = "\n".join(exports)
     
-    original_source = f"Generated from {os.path.basename(source_file)}"
+    original_source = f"Generated from {source_basename}"
     
     return PACKAGE_INIT_TEMPLATE.format(
         package_name=package_name,
@@ -108,30 +116,30 @@ def _generate_package_init(analysis_results: Dict[str, Any], package_name: str)
     )
 
 
-def _generate_readme(analysis_results: Dict[str, Any], package_name: str) -> str:
+def _generate_readme(analysis_results: Dict[str, Any], package_name: str, source_basename: str) -> str:
     """Generate README.md for the package.
     
     Args:
         analysis_results: Results from code analysis
         package_name: Name of the package
+        source_basename: File name of the original source
         
     Returns:
         Content for README.md
     """
-    source_file = analysis_results['file_info']['path']
-    package_description = f"Modular version of {os.path.basename(source_file)}"
+    package_description = f"Modular version of {source_basename}"
+    modules = analysis_results['modules']
     
     # Generate module list
-    module_list = ""
-    for module in analysis_results['modules']:
-        purpose = module.get('purpose', 'Unknown purpose')
-        module_list += f"- **{module['name']}**: {purpose}\n"
+    module_list = "".join(
+        f"- **{module.name}**: {module.purpose or 'Unknown purpose'}\n"
+        for module in modules
+    )
     
     # Find a good example import
     example_import = next(
-        (m['name'] for m in analysis_results['modules'] 
-         if m.get('functions') or m.get('classes')),
-        analysis_results['modules'][0]['name'] if analysis_results['modules'] else "module"
+        (m.name for m in modules if m.functions or m.classes),
+        modules[0].name if modules else "module"
     )
     
     return README_TEMPLATE.format(
@@ -140,12 +148,12 @@ def _generate_readme(analysis_results: Dict[str, Any], package_name: str) -> str
         module_list=module_list,
         package_import_name=package_name,
         example_import=example_import,
-        source_file=os.path.basename(source_file)
+        source_file=source_basename
     )
 
 
 def _generate_module_file(
-    module: Dict[str, Any], 
+    module: ModuleInfo, 
     package_name: str,
     output_path: Path
 ) -> Tuple[str, Path]:
@@ -159,22 +167,24 @@ def _generate_module_file(
     Returns:
         Tuple of (file content, file path)
     """
-    module_name = module['name']
+    module_name = module.name
     module_path = output_path / f"{module_name}.py"
     
     # Extract or infer module purpose and emoji
-    purpose = module.get('purpose', 'Module')
+    purpose = module.purpose or 'Module'
     
-    # Determine appropriate emoji
+    # Determine appropriate emoji, lowercasing the texts once for all keys
     emoji = DEFAULT_MODULE_EMOJIS["default"]
-    for key, value in DEFAULT_MODULE_EMOJIS.items():
-        if key in module_name.lower() or key in purpose.lower():
+    name_lower = module_name.lower()
+    purpose_lower = purpose.lower()
+    for key, value in _EMOJI_ITEMS:
+        if key in name_lower or key in purpose_lower:
             emoji = value
             break
     
     # Extract docstring from original content or create one
-    if "docstring" in module:
-        docstring = module["docstring"]
+    if module.docstring:
+        docstring = module.docstring
     else:
         description = f"Functionality extracted from {package_name}"
         docstring = MODULE_DOCSTRING_TEMPLATE.format(
@@ -185,7 +195,7 @@ def _generate_module_file(
         )
     
     # Extract module content, removing the original docstring if present
-    content = module['content']
+    content = module.content
     content = _remove_existing_docstring(content)
     
     # Add standardized docstring and imports
@@ -197,29 +207,46 @@ def _generate_module_file(
 def _remove_existing_docstring(content: str) -> str:
     """Remove existing docstring from code content.
     
+    Only the tokens of the first statement are read, so the rest of the
+    content is never tokenized or parsed.
+    
     Args:
         content: Source code content
         
     Returns:
         Content with docstring removed
     """
-    import ast
-    
+    docstring_end = 0
     try:
-        # Parse the content
-        tree = ast.parse(content)
-        
-        # Check if there's a module docstring
-        if (tree.body and isinstance(tree.body[0], ast.Expr) and 
-                isinstance(tree.body[0].value, ast.Str)):
-            # Get the end line of the docstring
-            end_line = tree.body[0].end_lineno
-            
-            # Skip the lines containing the docstring
-            lines = content.split('\n')
-            return '\n'.join(lines[end_line:])
+        for token in tokenize.generate_tokens(io.StringIO(content).readline):
+            if token.type in (tokenize.NL, tokenize.COMMENT):
+                continue
+            if token.type == tokenize.STRING and not _is_bytes_literal(token.string):
+                # Adjacent literals concatenate into a single docstring
+                docstring_end = token.end[0]
+            elif docstring_end and token.type in (tokenize.NEWLINE, tokenize.ENDMARKER):
+                # The literal forms a statement of its own, so it is a docstring:
+                # skip the lines containing it
+                lines = content.split('\n')
+                return '\n'.join(lines[docstring_end:])
+            else:
+                return content
+    except (tokenize.TokenError, SyntaxError):
+        # If tokenizing fails, return the original content
+        pass
+    
+    return content
+
+
+def _is_bytes_literal(literal: str) -> bool:
+    """Check whether a string token is a bytes literal, which is no docstring.
+    
+    Args:
+        literal: Source text of a STRING token
         
-        return content
-    except SyntaxError:
-        # If parsing fails, return the original content
-        return content
+    Returns:
+        True if the literal's prefix marks it as bytes
+    """
+    # The prefix is everything before the opening quote, the token's last character
+    prefix = literal.partition(literal[-1])[0]
+    return 'b' in prefix or 'B' in prefix
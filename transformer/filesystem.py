@@ -7,9 +7,13 @@ ensuring proper directory structure and file integrity.
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Union
 
+# Worker threads for file I/O, which releases the GIL
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 def generate_files(transformation_result: Dict[str, Any], dry_run: bool = False) -> List[str]:
     """Generate files on disk according to transformation results.
@@ -23,29 +27,40 @@ def generate_files(transformation_result: Dict[str, Any], dry_run: bool = False)
     """
     output_path = Path(transformation_result["output_path"])
     files = transformation_result["files"]
-    generated_paths = []
     
-    # Create output directory if it doesn't exist
-    if not dry_run:
-        output_path.mkdir(parents=True, exist_ok=True)
+    if dry_run:
+        return [f"[DRY RUN] Would create: {Path(file_info['path'])}" for file_info in files]
+    
+    # Keep one file per path, as module names can repeat; as with writing in
+    # order, the last one wins, and no two writers share a path
+    unique_files = list({Path(file_info["path"]): file_info for file_info in files}.values())
+    
+    # Create the output directory and each distinct parent directory once,
+    # shallowest first, so the writers never race on mkdir
+    parents = {output_path, *(Path(file_info["path"]).parent for file_info in unique_files)}
+    for directory in sorted(parents, key=lambda path: len(path.parts)):
+        directory.mkdir(parents=True, exist_ok=True)
     
-    # Generate each file
-    for file_info in files:
-        file_path = Path(file_info["path"])
+    # Generate each file; writes are independent and release the GIL
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        return list(executor.map(_write_file, unique_files))
+
+
+def _write_file(file_info: Dict[str, Any]) -> str:
+    """Write a single generated file.
+    
+    Args:
+        file_info: Generated file with its path and content
         
-        if not dry_run:
-            # Ensure parent directories exist
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write file content
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(file_info["content"])
-            
-            generated_paths.append(str(file_path))
-        else:
-            generated_paths.append(f"[DRY RUN] Would create: {file_path}")
-    
-    return generated_paths
+    Returns:
+        Path of the written file
+    """
+    file_path = Path(file_info["path"])
+    
+    # Write file content; parent directories already exist, encoded once and written in a single call
+    file_path.write_bytes(file_info["content"].encode("utf-8"))
+    
+    return str(file_path)
 
 
 def copy_additional_files(
@@ -67,25 +82,29 @@ def copy_additional_files(
     """
     source_path = Path(source_dir)
     dest_path = Path(dest_dir)
-    copied_files = []
     
     # Ensure destination exists
     if not dry_run:
         dest_path.mkdir(parents=True, exist_ok=True)
     
-    # Copy matching files
-    for pattern in file_patterns:
-        for file_path in source_path.glob(pattern):
-            if file_path.is_file():
-                dest_file = dest_path / file_path.name
-                
-                if not dry_run:
-                    shutil.copy2(file_path, dest_file)
-                    copied_files.append(str(dest_file))
-                else:
-                    copied_files.append(f"[DRY RUN] Would copy: {file_path} to {dest_file}")
-    
-    return copied_files
+    # Collect matching files by destination, so files matched by overlapping
+    # patterns are copied once; as with copying in order, the last match wins
+    copies = {
+        dest_path / file_path.name: file_path
+        for pattern in file_patterns
+        for file_path in source_path.glob(pattern)
+        if file_path.is_file()
+    }
+    
+    if dry_run:
+        return [f"[DRY RUN] Would copy: {file_path} to {dest_file}" for dest_file, file_path in copies.items()]
+    
+    # Copy them in parallel, as each destination is written by one copy only;
+    # the results are consumed so that a failed copy raises here
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        list(executor.map(lambda copy: shutil.copy2(copy[1], copy[0]), copies.items()))
+    
+    return [str(dest_file) for dest_file in copies]
 
 
 def clean_output_directory(
@@ -7,18 +7,23 @@ clean dependencies and proper symbol resolution in transformed code.
 
 import ast
 import re
-from typing import Dict, List, Set, Any, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Set, Any, Tuple
+
+from ..core.graph import strongly_connected_components
+from ..core.types import ModuleInfo
+from ..core.utils import NameHandler, NameSink, collect_names
 
 
 def reorganize_imports(
-    modules: List[Dict[str, Any]], 
+    modules: List[ModuleInfo], 
     dependency_graph: Any
 ) -> Dict[str, List[str]]:
     """Reorganize imports between modules based on dependency graph.
     
     Args:
         modules: List of module information
-        dependency_graph: NetworkX dependency graph
+        dependency_graph: Module dependency graph
         
     Returns:
         Dictionary mapping module names to required imports
@@ -27,7 +32,7 @@ def reorganize_imports(
     
     # For each module, determine required imports
     for module in modules:
-        module_name = module["name"]
+        module_name = module.name
         required_imports = []
         
         # Add direct dependencies
@@ -52,79 +57,40 @@ def _resolve_circular_dependencies(
 ) -> Dict[str, List[str]]:
     """Resolve circular dependencies in import structure.
     
+    Cycles are found as strongly connected components of the import graph.
+    In each one, the module with the fewest imports drops its import of
+    another member, repeating until no cycles remain.
+    
     Args:
         module_imports: Dictionary of module imports
         
     Returns:
         Cleaned import dictionary
     """
-    # Build dependency matrix
-    modules = list(module_imports.keys())
-    n = len(modules)
-    
-    # Initialize adjacency matrix
-    matrix = [[0 for _ in range(n)] for _ in range(n)]
-    
-    # Fill matrix with direct dependencies
-    module_indices = {name: i for i, name in enumerate(modules)}
-    
-    for module, imports in module_imports.items():
-        i = module_indices[module]
-        for imp in imports:
-            if imp in module_indices:
-                j = module_indices[imp]
-                matrix[i][j] = 1
-    
-    # Find cycles
-    visited = [0] * n
-    recursion_stack = [0] * n
-    cycles = []
-    
-    def dfs(node, path):
-        visited[node] = 1
-        recursion_stack[node] = 1
+    while True:
+        cycles = [
+            component for component in strongly_connected_components(module_imports)
+            if len(component) > 1 or component[0] in module_imports.get(component[0], ())
+        ]
+        if not cycles:
+            return module_imports
         
-        for neighbor in range(n):
-            if matrix[node][neighbor] == 1:
-                if recursion_stack[neighbor] == 1:
-                    # Cycle found
-                    cycle = path + [modules[neighbor]]
-                    if cycle not in cycles:
-                        cycles.append(cycle)
-                elif visited[neighbor] == 0:
-                    dfs(neighbor, path + [modules[neighbor]])
-        
-        recursion_stack[node] = 0
-    
-    for i in range(n):
-        if visited[i] == 0:
-            dfs(i, [modules[i]])
-    
-    # Break cycles by removing the weakest dependency in each cycle
-    for cycle in cycles:
-        # Find the dependency with the fewest imports
-        min_imports = float('inf')
-        weakest_link = (cycle[0], cycle[1])
-        
-        for i in range(len(cycle)):
-            from_module = cycle[i]
-            to_module = cycle[(i+1) % len(cycle)]
-            
-            count = len(module_imports.get(from_module, []))
-            if count < min_imports:
-                min_imports = count
-                weakest_link = (from_module, to_module)
-        
-        # Remove the weakest dependency
-        if weakest_link[1] in module_imports.get(weakest_link[0], []):
-            module_imports[weakest_link[0]].remove(weakest_link[1])
-    
-    return module_imports
+        # Break each cycle at its weakest dependency: every member has an
+        # import inside the component, so the weakest module always has one
+        for component in cycles:
+            members = set(component)
+            weakest = min(component, key=lambda module: len(module_imports[module]))
+            imports = module_imports[weakest]
+            imports.remove(next(imp for imp in imports if imp in members))
 
 
-def extract_used_symbols(content: str) -> Set[str]:
+@lru_cache(maxsize=4096)
+def extract_used_symbols(content: str) -> FrozenSet[str]:
     """Extract symbols that are actually used in the code content.
     
+    Memoized, as the same import names recur across modules; the result is
+    frozen so the shared cached value cannot be mutated by callers.
+    
     Args:
         content: Source code content
         
@@ -132,20 +98,12 @@ def extract_used_symbols(content: str) -> Set[str]:
         Set of symbol names used in code
     """
     try:
-        tree = ast.parse(content)
-        symbols = set()
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
-                symbols.add(node.id)
-            elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
-                symbols.add(node.func.id)
-                
-        return symbols
+        # Called functions are loaded names too, so one check covers calls
+        return frozenset(_loaded_names(ast.parse(content)))
     except SyntaxError:
         # Fallback to simple regex for partial code fragments
         pattern = r'\b([a-zA-Z_][a-zA-Z0-9_]*)\b'
-        return set(re.findall(pattern, content))
+        return frozenset(re.findall(pattern, content))
 
 
 def optimize_imports(
@@ -161,26 +119,42 @@ def optimize_imports(
     Returns:
         Optimized module import mapping
     """
-    # For each module, check which imports are actually used
-    optimized = {}
+    # Every module is checked against the same source, so parse it once
+    try:
+        module_tree = ast.parse(source)
+    except SyntaxError:
+        # If parsing fails, keep all imports
+        return dict(module_imports)
+    
+    # Extract used symbols
+    module_symbols = _loaded_names(module_tree)
     
+    # For each module, keep only imports with used symbols
+    optimized = {}
     for module, imports in module_imports.items():
-        # Find the module content in source modules
-        try:
-            module_tree = ast.parse(source)
-            module_symbols = set()
-            
-            # Extract used symbols
-            for node in ast.walk(module_tree):
-                if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
-                    module_symbols.add(node.id)
-            
-            # Keep only imports with used symbols
-            optimized[module] = [imp for imp in imports if any(
-                symbol in module_symbols for symbol in extract_used_symbols(imp)
-            )]
-        except SyntaxError:
-            # If parsing fails, keep all imports
-            optimized[module] = imports
+        optimized[module] = [imp for imp in imports if any(
+            symbol in module_symbols for symbol in extract_used_symbols(imp)
+        )]
     
     return optimized
+
+
+def _loaded_names(tree: ast.AST) -> Set[str]:
+    """Collect every name loaded anywhere in the AST.
+    
+    Args:
+        tree: AST to walk
+        
+    Returns:
+        Set of loaded names
+    """
+    return collect_names(tree, _LOAD_HANDLERS)
+
+
+def _loaded_name(node: ast.Name, add: NameSink) -> None:
+    # Variables and called functions being accessed
+    if isinstance(node.ctx, ast.Load):
+        add(node.id)
+
+
+_LOAD_HANDLERS: Dict[type, NameHandler] = {ast.Name: _loaded_name}
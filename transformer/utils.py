@@ -5,13 +5,83 @@ Provides utility functions for the transformation process, including
 path resolution, import management, and code formatting.
 """
 
+import os
 import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional, Union, Tuple, Dict, List, Any
+from typing import Iterator, Optional, Pattern, Union, Tuple, List, Any, Set
 
+from ..core.types import ModuleInfo
 from ..core.utils import derive_package_name, derive_output_dir
 
+# Import patterns are compiled with RE2 when its bindings are installed, which
+# matches in linear time without backtracking; the pattern avoids lookaround
+# so both engines accept it
+try:
+    import re2 as _import_re  # type: ignore[import-not-found]  # pragma: no cover
+except ImportError:
+    _import_re = re
 
+# Function name keywords are matched with an Aho-Corasick automaton when
+# pyahocorasick is installed, in time linear in the names however many
+# keywords there are
+try:
+    import ahocorasick  # type: ignore[import-not-found]  # pragma: no cover
+except ImportError:
+    ahocorasick = None
+
+# Replacements for rewritten imports, filled with the new package
+_DIRECT_IMPORT_REPLACEMENT = "import {package}"
+_FROM_IMPORT_REPLACEMENT = "from {package} "
+
+# Leading indentation and call punctuation wrapped at by the fallback formatter
+_INDENT_RE = re.compile(r"^(\s+)")
+_WRAP_DELIMITERS = "(,)"
+_IMPORT_PREFIXES = ("import ", "from ")
+
+# Function name keywords and the standard library imports they suggest
+_KEYWORD_IMPORTS = {
+    "path": "from pathlib import Path",
+    "file": "from pathlib import Path",
+    "json": "import json",
+}
+_NAME_KEYWORD_RE = re.compile("|".join(_KEYWORD_IMPORTS))
+
+
+def _build_keyword_automaton() -> Optional[Any]:
+    """Build the keyword automaton once at import, mapping keywords to imports.
+    
+    Returns:
+        The automaton, or None if pyahocorasick is not installed
+    """
+    if ahocorasick is not None:  # pragma: no cover
+        automaton = ahocorasick.Automaton()
+        for keyword, suggested in _KEYWORD_IMPORTS.items():
+            automaton.add_word(keyword, suggested)
+        automaton.make_automaton()
+        return automaton
+    return None
+
+
+_NAME_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# Seconds a Ruff run may take before formatting falls back to Black
+_RUFF_TIMEOUT = 30
+
+# Boilerplate import lines shared by every generated module
+_DICT_IMPORT = sys.intern("from typing import Dict")
+_TYPING_IMPORT = sys.intern("from typing import Dict, List, Optional, Any, Union")
+
+# Every standard library import the rules can suggest, in output order
+_STD_LIB_ORDER = tuple(sorted({*_KEYWORD_IMPORTS.values(), _DICT_IMPORT}))
+
+
+@lru_cache(maxsize=1024)
 def resolve_output_path(
     source_path: Path,
     output_dir: Optional[Union[str, Path]] = None,
@@ -19,6 +89,9 @@ def resolve_output_path(
 ) -> Tuple[Path, str]:
     """Resolve the output path and package name.
     
+    The result depends only on the arguments, so it is memoized across the
+    passes of a transformation; ``resolve_output_path.cache_clear()`` resets it.
+    
     Args:
         source_path: Path to source file
         output_dir: Optional output directory
@@ -32,7 +105,8 @@ def resolve_output_path(
     
     # Determine output directory
     if output_dir:
-        output_path = Path(output_dir)
+        # Reuse a given Path rather than constructing a copy of it
+        output_path = output_dir if isinstance(output_dir, Path) else Path(output_dir)
     else:
         output_path = derive_output_dir(source_path, resolved_package)
     
@@ -54,22 +128,57 @@ def sanitize_imports(
     Returns:
         Updated source code
     """
-    # Handle direct imports
-    pattern = rf"import\s+{re.escape(original_package)}(\s+as\s+\w+)?"
-    replacement = f"import {new_package}\\1"
-    content = re.sub(pattern, replacement, content)
+    # Every match contains the package name, so content without it is unchanged
+    if original_package not in content:
+        return content
     
-    # Handle from imports
-    pattern = rf"from\s+{re.escape(original_package)}\s+import"
-    replacement = f"from {new_package} import"
-    content = re.sub(pattern, replacement, content)
+    direct_replacement = _DIRECT_IMPORT_REPLACEMENT.format(package=new_package)
+    from_replacement = _FROM_IMPORT_REPLACEMENT.format(package=new_package)
     
-    return content
+    def replace_import(match: "re.Match[str]") -> str:
+        is_from = match.group("from") is not None
+        is_direct = match.group("direct") is not None
+        # Leave a bare ``import`` keyword untouched
+        if not (is_from or is_direct):
+            return match.group(0)
+        # Handle from imports
+        head = from_replacement if is_from else ""
+        # Handle direct imports, including one following a from import
+        if is_direct:
+            return head + direct_replacement + (match.group("alias") or "")
+        return head + "import"
+    
+    return _import_pattern(original_package).sub(replace_import, content)
+
+
+@lru_cache(maxsize=256)
+def _import_pattern(package: str) -> Pattern[str]:
+    """Compile the import pattern for a package once, reused across files.
+    
+    Every match is anchored on an ``import`` keyword, optionally preceded
+    by a from clause naming the package and followed by the package itself,
+    so direct and from imports, as well as both at once in
+    ``from pkg import pkg``, are found in a single scan.
+    
+    Args:
+        package: Package/module name the imports refer to
+        
+    Returns:
+        Compiled import pattern
+    """
+    escaped = re.escape(package)
+    pattern: Pattern[str] = _import_re.compile(
+        rf"(?P<from>from\s+{escaped}\s+)?import(?P<direct>\s+{escaped}(?P<alias>\s+as\s+\w+)?)?"
+    )
+    return pattern
 
 
 def format_code(content: str, max_line_length: int = 88) -> str:
     """Format code to ensure consistent style.
     
+    Content without tabs whose lines all fit the limit is already
+    conformant and is returned unchanged, without invoking a formatter.
+    
     Args:
         content: Source code to format
         max_line_length: Maximum line length for wrapping
@@ -77,56 +186,300 @@ def format_code(content: str, max_line_length: int = 88) -> str:
     Returns:
         Formatted code
     """
+    if _is_conformant(content, max_line_length):
+        return content
+    
+    # Try Ruff's formatter first, a native binary much faster than Black
+    formatted = _ruff_format(content, max_line_length)
+    if formatted is not None:
+        return formatted
+    
+    # Try using Black if available
+    black_mode = _black_mode(max_line_length)
+    if black_mode is not None:
+        black, mode = black_mode
+        return black.format_str(content, mode=mode)
+    
+    # Basic formatting as fallback
+    lines = content.splitlines()
+    formatted_lines = []
+    
+    # Simple line handling: only long lines with calls can change besides
+    # blank ones, so every other line is kept before any further checks
+    for line in lines:
+        # Keep line breaks
+        if not line or line.isspace():
+            formatted_lines.append("")
+            continue
+        
+        # Keep lines within the limit, and long lines with nothing to wrap at;
+        # a call's parentheses sit near the ends, so each is searched from
+        # the nearer end
+        if len(line) <= max_line_length or line.find("(") == -1 or line.rfind(")") == -1:
+            formatted_lines.append(line)
+            continue
+        
+        # Preserve indentation
+        indent_match = _INDENT_RE.match(line)
+        indent = indent_match.group(1) if indent_match else ""
+        
+        # Handle import grouping, checking past the indentation in place
+        if line.startswith(_IMPORT_PREFIXES, len(indent)):
+            formatted_lines.append(line)
+            continue
+        
+        # Simple wrap for long function calls and parameters
+        formatted_lines.extend(_wrap_line(line, indent, max_line_length))
+    
+    return "\n".join(formatted_lines)
+
+
+def format_code_batch(
+    contents: List[str],
+    max_line_length: int = 88,
+    workers: Optional[int] = None
+) -> List[str]:
+    """Format many sources at once.
+    
+    Conformant sources are passed through. The rest are formatted by a
+    single ``ruff format`` run over the whole batch when Ruff is installed;
+    otherwise, or if that run fails, they are fanned out over a process
+    pool, as Black is pure Python and holds the GIL. A single source is
+    formatted in this process, as starting a pool would cost more than it
+    saves.
+    
+    Args:
+        contents: Source code of each file to format
+        max_line_length: Maximum line length for wrapping
+        workers: Number of worker processes (default: CPU count)
+        
+    Returns:
+        Formatted code, in the order of the given sources
+    """
+    results = list(contents)
+    pending = [index for index, content in enumerate(contents) if not _is_conformant(content, max_line_length)]
+    if not pending:
+        return results
+    pending_contents = [contents[index] for index in pending]
+    
+    # One Ruff process for the whole batch
+    formatted = _ruff_format_batch(pending_contents, max_line_length)
+    if formatted is None:
+        format_one = partial(format_code, max_line_length=max_line_length)
+        if len(pending_contents) == 1:
+            formatted = [format_one(pending_contents[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+                formatted = list(executor.map(format_one, pending_contents, chunksize=8))
+    
+    for index, content in zip(pending, formatted):
+        results[index] = content
+    return results
+
+
+def _is_conformant(content: str, max_line_length: int) -> bool:
+    """Check whether content is free of tabs and has no line over the limit.
+    
+    Args:
+        content: Source code to check
+        max_line_length: Maximum line length
+        
+    Returns:
+        True if the content needs no formatting
+    """
+    return "\t" not in content and all(len(line) <= max_line_length for line in content.splitlines())
+
+
+def _wrap_line(line: str, indent: str, max_line_length: int) -> List[str]:
+    """Wrap a long line at call punctuation.
+    
+    Pieces of the line being built are buffered in a list with a running
+    length and joined once per emitted line, instead of concatenating
+    strings part by part.
+    
+    Args:
+        line: Line to wrap
+        indent: Indentation of the line
+        max_line_length: Maximum line length
+        
+    Returns:
+        Wrapped lines
+    """
+    wrapped = []
+    pieces: List[str] = []
+    length = 0
+    has_text = False
+    
+    for part in _split_at_delimiters(line):
+        if length + len(part) > max_line_length and has_text:
+            wrapped.append("".join(pieces))
+            part = indent + "    " + part.lstrip()
+            pieces = [part]
+            length = len(part)
+            has_text = bool(part) and not part.isspace()
+        else:
+            pieces.append(part)
+            length += len(part)
+            has_text = has_text or (bool(part) and not part.isspace())
+    
+    if has_text:
+        wrapped.append("".join(pieces))
+    
+    return wrapped
+
+
+def _split_at_delimiters(line: str) -> Iterator[str]:
+    """Split a line around call punctuation, keeping each delimiter as a part.
+    
+    Yields the same parts as ``re.split(r"([(,)])", line)``. The next
+    position of each delimiter is tracked with ``str.find`` and only
+    advanced once consumed, so the line is scanned once per delimiter.
+    
+    Args:
+        line: Line to split
+        
+    Returns:
+        Iterator of text parts alternating with single delimiters
+    """
+    upcoming = {delimiter: line.find(delimiter) for delimiter in _WRAP_DELIMITERS}
+    upcoming = {delimiter: index for delimiter, index in upcoming.items() if index != -1}
+    start = 0
+    
+    while upcoming:
+        delimiter = min(upcoming, key=upcoming.__getitem__)
+        index = upcoming[delimiter]
+        yield line[start:index]
+        yield delimiter
+        start = index + 1
+        
+        next_index = line.find(delimiter, start)
+        if next_index == -1:
+            del upcoming[delimiter]
+        else:
+            upcoming[delimiter] = next_index
+    
+    yield line[start:]
+
+
+@lru_cache(maxsize=None)
+def _ruff_executable() -> Optional[str]:
+    """Locate the Ruff executable on first use.
+    
+    Returns:
+        Path to ruff, or None if it is not installed
+    """
+    return shutil.which("ruff")
+
+
+def _ruff_format(content: str, line_length: int) -> Optional[str]:
+    """Format code with ``ruff format``, reading it from stdin.
+    
+    Project configuration is ignored, so the result depends only on the
+    line length, as with Black.
+    
+    Args:
+        content: Source code to format
+        line_length: Maximum line length
+        
+    Returns:
+        Formatted code, or None if Ruff is not installed or cannot format it
+    """
+    result = _run_ruff_format(line_length, "-", content.encode("utf-8"))
+    if result is None or result.returncode != 0:
+        return None
+    return result.stdout.decode("utf-8")
+
+
+def _ruff_format_batch(contents: List[str], line_length: int) -> Optional[List[str]]:
+    """Format many sources with a single ``ruff format`` run.
+    
+    The sources are written to a temporary directory that Ruff formats in
+    place, so one process serves the whole batch.
+    
+    Args:
+        contents: Source code of each file to format
+        line_length: Maximum line length
+        
+    Returns:
+        Formatted code in the given order, or None if Ruff is not installed
+        or cannot format every source
+    """
+    if _ruff_executable() is None:
+        return None
+    
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [Path(directory) / f"module_{index}.py" for index in range(len(contents))]
+        for path, content in zip(paths, contents):
+            path.write_bytes(content.encode("utf-8"))
+        
+        result = _run_ruff_format(line_length, directory)
+        if result is None or result.returncode != 0:
+            return None
+        return [path.read_bytes().decode("utf-8") for path in paths]
+
+
+def _run_ruff_format(
+    line_length: int,
+    target: str,
+    stdin: Optional[bytes] = None
+) -> Optional["subprocess.CompletedProcess[bytes]"]:
+    """Run ``ruff format`` on a target, ignoring project configuration.
+    
+    Args:
+        line_length: Maximum line length
+        target: Path to format, or ``-`` to format stdin
+        stdin: Source code to pass on stdin
+        
+    Returns:
+        The completed process, or None if Ruff is not installed, could not
+        be started or did not finish within the timeout
+    """
+    ruff = _ruff_executable()
+    if ruff is None:
+        return None
+    
+    try:
+        return subprocess.run(
+            [ruff, "format", "--isolated", "--line-length", str(line_length), target],
+            input=stdin,
+            capture_output=True,
+            timeout=_RUFF_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+
+
+@lru_cache(maxsize=None)
+def _load_black() -> Optional[Any]:
+    """Import Black on first use, remembering whether it is installed.
+    
+    Returns:
+        The black module, or None if it is not installed
+    """
     try:
-        # Try using Black if available
         import black
-        mode = black.Mode(line_length=max_line_length)
-        formatted = black.format_str(content, mode=mode)
-        return formatted
-    except (ImportError, ModuleNotFoundError):
-        # Basic formatting as fallback
-        lines = content.splitlines()
-        formatted_lines = []
-        
-        # Simple line handling
-        for line in lines:
-            # Keep line breaks
-            if not line.strip():
-                formatted_lines.append("")
-                continue
-                
-            # Handle import grouping
-            if line.strip().startswith("import ") or line.strip().startswith("from "):
-                formatted_lines.append(line)
-                continue
-            
-            # Preserve indentation
-            indent_match = re.match(r"^(\s+)", line)
-            indent = indent_match.group(1) if indent_match else ""
-            
-            # Simple wrap for long lines
-            if len(line) > max_line_length:
-                # For function calls and parameters
-                if "(" in line and ")" in line:
-                    parts = re.split(r"([(,)])", line)
-                    current_line = ""
-                    for part in parts:
-                        if len(current_line + part) > max_line_length and current_line.strip():
-                            formatted_lines.append(current_line)
-                            current_line = indent + "    " + part.lstrip()
-                        else:
-                            current_line += part
-                    if current_line.strip():
-                        formatted_lines.append(current_line)
-                else:
-                    formatted_lines.append(line)
-            else:
-                formatted_lines.append(line)
-        
-        return "\n".join(formatted_lines)
-
-
-def generate_imports(module_info: Dict[str, Any], dependencies: List[str]) -> str:
+    except ImportError:
+        return None
+    return black
+
+
+@lru_cache(maxsize=8)
+def _black_mode(line_length: int) -> Optional[Tuple[Any, Any]]:
+    """Build the Black mode for a line length once.
+    
+    Args:
+        line_length: Maximum line length
+        
+    Returns:
+        Tuple of (black module, mode), or None if Black is not installed
+    """
+    black = _load_black()
+    if black is None:
+        return None
+    return black, black.Mode(line_length=line_length)
+
+
+def generate_imports(module_info: ModuleInfo, dependencies: List[str]) -> str:
     """Generate import statements for a module based on its dependencies.
     
     Args:
@@ -136,40 +489,57 @@ def generate_imports(module_info: Dict[str, Any], dependencies: List[str]) -> st
     Returns:
         Import statements as string
     """
-    imports = []
+    names, args = _function_columns(module_info)
     
-    # Standard library imports
-    std_lib_imports = set()
-    for func in module_info.get("functions", []):
-        # Add common imports based on function usage patterns
-        if "path" in func["name"].lower() or "file" in func["name"].lower():
-            std_lib_imports.add("from pathlib import Path")
-        if "json" in func["name"].lower():
-            std_lib_imports.add("import json")
-        if any(arg.endswith("dict") for arg in func["args"]):
-            std_lib_imports.add("from typing import Dict")
+    # Standard library imports, based on function usage patterns: every
+    # keyword in the lowercased names is found in one scan
+    std_lib_imports = _keyword_imports(names.lower())
+    
+    # Any dict-named argument in the module calls for the Dict type
+    if "dict\n" in args:
+        std_lib_imports.add(_DICT_IMPORT)
     
     # Type imports
-    type_imports = set()
-    if module_info.get("functions") or module_info.get("classes"):
-        type_imports.add("from typing import Dict, List, Optional, Any, Union")
+    type_imports = [_TYPING_IMPORT] if module_info.functions or module_info.classes else []
     
-    # Dependency imports
-    dep_imports = set()
-    for dep in dependencies:
-        dep_imports.add(f"from .{dep} import *")
+    # Dependency imports, interned as the same lines recur across modules
+    dep_imports = sorted({sys.intern(f"from .{dep} import *") for dep in dependencies})
     
-    # Add imports in correct order
-    if std_lib_imports:
-        imports.extend(sorted(std_lib_imports))
-        imports.append("")
+    # Add imports in correct order, one blank line after each section; the
+    # rule-based imports are laid out in their fixed order without sorting
+    std_lib_section = [line for line in _STD_LIB_ORDER if line in std_lib_imports]
+    sections = [section for section in (std_lib_section, type_imports, dep_imports) if section]
+    return "\n\n".join("\n".join(section) for section in sections) + ("\n" if sections else "")
+
+
+def _function_columns(module_info: ModuleInfo) -> Tuple[str, str]:
+    """Lay out a module's function names and arguments as two columns.
     
-    if type_imports:
-        imports.extend(sorted(type_imports))
-        imports.append("")
+    Each column is a single string with one entry per line, so a field is
+    scanned across all functions with one call instead of one per entry.
+    Identifiers never contain newlines, so no match spans two entries.
     
-    if dep_imports:
-        imports.extend(sorted(dep_imports))
-        imports.append("")
+    Args:
+        module_info: Module information from analysis
+        
+    Returns:
+        Tuple of (function names, arguments), each entry ending in a newline
+    """
+    functions = module_info.functions
+    names = "".join(f"{func.name}\n" for func in functions)
+    args = "".join(f"{arg}\n" for func in functions for arg in func.args)
+    return names, args
+
+
+def _keyword_imports(names: str) -> Set[str]:
+    """Collect the imports suggested by keywords in lowercased names.
     
-    return "\n".join(imports)
+    Args:
+        names: Lowercased function names, one per line
+        
+    Returns:
+        Set of import statements
+    """
+    if _NAME_KEYWORD_AUTOMATON is not None:  # pragma: no cover
+        return {suggested for _, suggested in _NAME_KEYWORD_AUTOMATON.iter(names)}
+    return {_KEYWORD_IMPORTS[keyword] for keyword in _NAME_KEYWORD_RE.findall(names)}